@@ -23,18 +23,33 @@ async def main() -> None:
 
     # Use async context manager for automatic cleanup
     async with AsyncNovitaClient() as client:
-        # List all instances concurrently with getting pricing
-        print("\nFetching instances and pricing concurrently...")
-        instances_task = client.gpu.instances.list()
-        pricing_task = client.gpu.products.list()
-
-        instances, products = await asyncio.gather(instances_task, pricing_task)
-
-        print(f"✓ Total instances: {len(instances)}")
-        print(f"✓ Available GPU types: {len(products)}")
-        for product in products[:3]:  # Show first 3
-            price_str = f"${product.price:.2f}" if product.price is not None else "N/A"
-            print(f"  - {product.name}: {price_str}/hour")
+        # Fire the three independent list calls concurrently; the run
+        # takes ~max(RTT) instead of the sum of the three round trips.
+        print("\nFetching instances, pricing and clusters concurrently...")
+        instances, products, clusters = await asyncio.gather(
+            client.gpu.instances.list(),
+            client.gpu.products.list(),
+            client.gpu.clusters.list(),
+            return_exceptions=True,
+        )
+
+        if isinstance(instances, BaseException):
+            print(f"✗ Failed to list instances: {instances}")
+        else:
+            print(f"✓ Total instances: {len(instances)}")
+
+        if isinstance(products, BaseException):
+            print(f"✗ Failed to list products: {products}")
+        else:
+            print(f"✓ Available GPU types: {len(products)}")
+            for product in products[:3]:  # Show first 3
+                price_str = f"${product.price:.2f}" if product.price is not None else "N/A"
+                print(f"  - {product.name}: {price_str}/hour")
+
+        if isinstance(clusters, BaseException):
+            print(f"✗ Failed to list clusters: {clusters}")
+        else:
+            print(f"✓ Clusters: {len(clusters)}")
 
 
 if __name__ == "__main__":
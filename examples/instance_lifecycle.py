@@ -2,57 +2,62 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-import time
 
 from novita import (
     APIError,
+    AsyncNovitaClient,
     BadRequestError,
     BillingMode,
     CreateInstanceRequest,
     EditInstanceRequest,
     Kind,
-    NovitaClient,
+    Status,
 )
 
+# Read once at import; the client reuses the value instead of
+# consulting the environment again in its constructor.
+_API_KEY = os.environ.get("NOVITA_API_KEY")
 
-def main() -> None:
+_EQ = "=" * 60
+_STEP_TMPL = f"\n{_EQ}\nSTEP {{n}}: {{title}}\n{_EQ}"
+
+
+async def main() -> None:
     # Check for API key
-    if not os.environ.get("NOVITA_API_KEY"):
+    if not _API_KEY:
         print("Error: NOVITA_API_KEY environment variable is not set")
         print("Please set it with: export NOVITA_API_KEY='your-api-key-here'")
         return
 
-    with NovitaClient() as client:
-        print("=" * 60)
-        print("STEP 1: Pick an RTX 4090 (Prefer Spot Pricing)")
-        print("=" * 60)
-        # Use API filtering to find available RTX 4090 products
-        # Note: API doesn't support filtering by availability, so we filter client-side
-        products = client.gpu.products.list(
+    async with AsyncNovitaClient(api_key=_API_KEY) as client:
+        print(_STEP_TMPL.format(n=1, title="Pick an RTX 4090 (Prefer Spot Pricing)").lstrip("\n"))
+        # Push the spot filter server-side to shrink the response; fall
+        # back to the unfiltered list when no spot 4090s are offered.
+        # Note: API doesn't support filtering by availability, so that
+        # part stays client-side.
+        products = await client.gpu.products.list(
             product_name="4090",  # Fuzzy match for RTX 4090
+            billing_method="spot",
         )
-        if not products:
-            raise RuntimeError("No RTX 4090 products available")
-
-        # Filter for available products and prefer spot pricing
         available_products = [p for p in products if p.available_deploy]
+        billing_mode = BillingMode.spot
+
+        if not available_products:
+            products = await client.gpu.products.list(product_name="4090")
+            if not products:
+                raise RuntimeError("No RTX 4090 products available")
+            available_products = [p for p in products if p.available_deploy]
+            billing_mode = BillingMode.on_demand
+
         if not available_products:
             raise RuntimeError(
                 f"Found {len(products)} RTX 4090 products, "
                 "but none are currently available to deploy"
             )
 
-        # Prefer spot pricing if available
-        spot_products = [
-            p
-            for p in available_products
-            if "spot" in [m.lower() for m in (p.billing_methods or [])]
-        ]
-        product = spot_products[0] if spot_products else available_products[0]
-
-        # Determine billing mode based on what's supported
-        billing_mode = BillingMode.spot if spot_products else BillingMode.on_demand
+        product = available_products[0]
 
         product_id = product.id
         min_rootfs = product.min_root_fs or 50
@@ -61,9 +66,7 @@ def main() -> None:
         inventory_state = product.inventory_state.value if product.inventory_state else "unknown"
         print(f"  Inventory: {inventory_state}")
 
-        print("\n" + "=" * 60)
-        print("STEP 2: Creating GPU instance")
-        print("=" * 60)
+        print(_STEP_TMPL.format(n=2, title="Creating GPU instance"))
         request = CreateInstanceRequest(
             name="lifecycle-demo",
             product_id=product_id,
@@ -75,7 +78,7 @@ def main() -> None:
         )
 
         try:
-            response = client.gpu.instances.create(request)
+            response = await client.gpu.instances.create(request)
             instance_id = response.id
             print(f"✓ Created instance: {instance_id}")
         except BadRequestError as e:
@@ -91,36 +94,30 @@ def main() -> None:
                 print(f"  Response: {e.response_body}")
             return
 
-        print("\n" + "=" * 60)
-        print("STEP 3: Getting instance details")
-        print("=" * 60)
-        instance = client.gpu.instances.get(instance_id)
+        print(_STEP_TMPL.format(n=3, title="Getting instance details"))
+        instance = await client.gpu.instances.get(instance_id)
         print(f"✓ Name: {instance.name}")
         print(f"  Status: {instance.status.value}")
         print(f"  Rootfs: {instance.rootfs_size}GB")
 
-        print("\n" + "=" * 60)
-        print("STEP 4: Updating instance configuration")
-        print("=" * 60)
+        print(_STEP_TMPL.format(n=4, title="Updating instance configuration"))
         update = EditInstanceRequest(
             instance_id=instance_id, expand_root_disk=instance.rootfs_size + 50
         )
-        client.gpu.instances.edit(update)
+        await client.gpu.instances.edit(update)
         print("✓ Expansion request submitted")
 
-        print("\n" + "=" * 60)
-        print("STEP 5: Stopping instance")
-        print("=" * 60)
-        client.gpu.instances.stop(instance_id)
+        print(_STEP_TMPL.format(n=5, title="Stopping instance"))
+        await client.gpu.instances.stop(instance_id)
         print("✓ Stop initiated")
 
-        # Poll for stopped status
-        for _ in range(30):  # ~60 second timeout (30 * 2s)
-            instance = client.gpu.instances.get(instance_id)
-            if instance.status.value == "exited":
-                print("✓ Instance stopped successfully")
-                break
-            time.sleep(2)
+        # Wait for stopped status; the SDK helper polls with exponential
+        # backoff instead of a fixed interval.
+        instance = await client.gpu.instances.wait_for_status(instance_id, "exited", timeout=60)
+        # Identity compare against the enum member; no .value string
+        # round trip per check.
+        if instance.status is Status.exited:
+            print("✓ Instance stopped successfully")
         else:
             # Timeout reached without instance stopping
             print("⚠ Warning: Instance did not stop within 60 seconds")
@@ -128,14 +125,12 @@ def main() -> None:
             print(f"  Current status: {instance.status.value}")
             print("  Proceeding with deletion anyway...")
 
-        print("\n" + "=" * 60)
-        print("STEP 6: Deleting instance")
-        print("=" * 60)
-        client.gpu.instances.delete(instance_id)
+        print(_STEP_TMPL.format(n=6, title="Deleting instance"))
+        await client.gpu.instances.delete(instance_id)
         print("✓ Instance deletion requested")
 
         print("\n✓ Lifecycle demo complete!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
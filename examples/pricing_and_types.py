@@ -3,84 +3,112 @@
 from __future__ import annotations
 
 import os
+import statistics
+import sys
+from typing import TYPE_CHECKING
 
 from novita import NovitaClient
 
+if TYPE_CHECKING:
+    from novita.generated.models import GPUProduct
 
-def display_pricing(client: NovitaClient) -> None:
-    print("=" * 60)
-    print("GPU Instance Pricing")
-    print("=" * 60)
+# Read once at import; the client reuses the value instead of
+# consulting the environment again in its constructor.
+_API_KEY = os.environ.get("NOVITA_API_KEY")
+
+_EQ = "=" * 60
+_DASH = "-" * 60
 
-    products = client.gpu.products.list()
+
+def display_pricing(products: list[GPUProduct]) -> None:
+    print(_EQ)
+    print("GPU Instance Pricing")
+    print(_EQ)
 
     print(f"\nTotal GPU types available: {len(products)}\n")
 
     sorted_pricing = sorted(products, key=lambda x: x.price or 0)
 
-    print(f"{'Instance Type':<25} {'Price/Hour':<15} {'Available':<10}")
-    print("-" * 60)
-
+    # Build the whole table and emit it with one write instead of a
+    # locked, flushing print call per row.
+    rows = [f"{'Instance Type':<25} {'Price/Hour':<15} {'Available':<10}", _DASH]
     for item in sorted_pricing:
-        price = item.price or 0
-        price_str = f"${price:.2f}"
+        price_str = f"${(item.price or 0):.2f}"
         available_str = "✓ Yes" if item.available_deploy else "✗ No"
-        print(f"{item.id:<25} {price_str:<15} {available_str:<10}")
+        rows.append(f"{item.id:<25} {price_str:<15} {available_str:<10}")
+    sys.stdout.write("\n".join(rows) + "\n")
 
 
-def find_best_value(client: NovitaClient) -> None:
-    print("=" * 60)
+def find_best_value(products: list[GPUProduct]) -> None:
+    print(_EQ)
     print("Best Value Analysis")
-    print("=" * 60 + "\n")
+    print(_EQ + "\n")
 
-    products = client.gpu.products.list()
     available = [p for p in products if p.available_deploy]
-    available.sort(key=lambda x: x.price or float("inf"))
 
     if not available:
         print("⚠ No GPU instances currently available")
         return
 
-    cheapest = available[0]
+    # Only the cheapest, median and priciest entries are shown. min/max
+    # are single passes; median_low still sorts internally, but over
+    # lightweight (price, index) pairs rather than the model objects,
+    # and the paired index points straight at the median product.
+    def price_key(p: GPUProduct) -> float:
+        return p.price or float("inf")
+
+    cheapest = min(available, key=price_key)
     print("Recommendations:\n")
     print(f"💰 Most Economical: {cheapest.id}")
     print(f"   ${(cheapest.price or 0):.2f}/hour\n")
 
     if len(available) > 2:
-        mid = available[len(available) // 2]
+        _, mid_index = statistics.median_low((price_key(p), i) for i, p in enumerate(available))
+        mid = available[mid_index]
         print(f"⚖️  Balanced Option: {mid.id}")
         print(f"   ${(mid.price or 0):.2f}/hour\n")
 
-    premium = available[-1]
+    premium = max(available, key=price_key)
     print(f"🚀 Maximum Performance: {premium.id}")
     print(f"   ${(premium.price or 0):.2f}/hour\n")
 
 
+# Billing periods shown by estimate_costs, frozen at import time.
+_COST_PERIODS: tuple[tuple[str, int], ...] = (
+    ("1 hour", 1),
+    ("8 hours", 8),
+    ("24 hours", 24),
+    ("1 week", 24 * 7),
+    ("1 month", 24 * 30),
+)
+
+
 def estimate_costs(instance_type: str, price_per_hour: float) -> None:
-    print(f"\nCost Estimates for {instance_type}:")
-    print(f"  1 hour:   ${price_per_hour * 1:.2f}")
-    print(f"  8 hours:  ${price_per_hour * 8:.2f}")
-    print(f"  24 hours: ${price_per_hour * 24:.2f}")
-    print(f"  1 week:   ${price_per_hour * 24 * 7:.2f}")
-    print(f"  1 month:  ${price_per_hour * 24 * 30:.2f}")
+    # Compute and render every period in one comprehension, emitted as a
+    # single block rather than one print per period.
+    lines = [f"  {label:<8}: ${price_per_hour * hours:.2f}" for label, hours in _COST_PERIODS]
+    print(f"\nCost Estimates for {instance_type}:\n" + "\n".join(lines))
 
 
 def main() -> None:
     # Check for API key
-    if not os.environ.get("NOVITA_API_KEY"):
+    if not _API_KEY:
         print("Error: NOVITA_API_KEY environment variable is not set")
         print("Please set it with: export NOVITA_API_KEY='your-api-key-here'")
         return
 
-    with NovitaClient() as client:
-        display_pricing(client)
+    with NovitaClient(api_key=_API_KEY) as client:
+        # Fetch the catalog once and share it; both helpers read the same data.
+        products = client.gpu.products.list()
+
+        display_pricing(products)
 
         print()
-        find_best_value(client)
+        find_best_value(products)
 
-        print("=" * 60)
+        print(_EQ)
         print("Cost Estimation Example")
-        print("=" * 60)
+        print(_EQ)
         estimate_costs(instance_type="A100_80GB", price_per_hour=3.50)
 
         print("\n✓ Pricing analysis complete!")
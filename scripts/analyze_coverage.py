@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Analyze unit-test coverage of GPU resource methods.
+
+Compares the sync/async methods defined on each resource class under
+src/novita/api/resources/gpu/ against the gpu.<resource>.<method>() calls
+exercised by the unit tests, and reports which methods lack tests.
+"""
+
+from __future__ import annotations
+
+import bisect
+import concurrent.futures
+import functools
+import os
+import re
+import sys
+from pathlib import Path
+
+# Resource modules under src/novita/api/resources/gpu/.
+RESOURCES = (
+    "clusters",
+    "endpoints",
+    "image_prewarm",
+    "instances",
+    "jobs",
+    "metrics",
+    "networks",
+    "products",
+    "registries",
+    "storages",
+    "templates",
+)
+
+# Test files follow test_gpu_{resource}.py except where noted here.
+TEST_FILE_OVERRIDES = {"image_prewarm": "test_gpu_images.py"}
+
+
+@functools.cache
+def _call_re(resource_name: str) -> re.Pattern[bytes]:
+    """Compiled gpu.<resource>.<method>( pattern, cached per resource."""
+    return re.compile(rb"\bgpu\." + re.escape(resource_name).encode() + rb"\.(\w+)\(")
+
+
+@functools.lru_cache(maxsize=128)
+def _read(file_path: Path) -> bytes:
+    """Read a file once and cache the raw bytes for repeated queries.
+
+    Working in bytes also skips the UTF-8 decode pass that read_text
+    pays on every call; the sources scanned here are ASCII-safe.
+    """
+    return file_path.read_bytes()
+
+
+def extract_methods(file_path: Path) -> tuple[set[str], set[str]]:
+    """Extract public method names from a resource module.
+
+    Args:
+        file_path: Path to the resource source file
+
+    Returns:
+        Tuple of (sync_methods, async_methods) defined on the
+        BaseResource/AsyncBaseResource subclasses in the file
+    """
+    content = _read(file_path)
+
+    # Collected straight into sets; analyze_resource only needs
+    # membership and sizes, so skip the intermediate lists.
+    sync_methods: set[str] = set()
+    async_methods: set[str] = set()
+
+    # Single line-oriented pass: track which kind of resource class we are
+    # inside and collect def/async def names as they appear. One traversal
+    # of the source instead of separate class-body and method regex sweeps.
+    mode: str | None = None
+    for line in content.splitlines():
+        if line.startswith(b"class "):
+            if line.endswith(b"(BaseResource):"):
+                mode = "sync"
+            elif line.endswith(b"(AsyncBaseResource):"):
+                mode = "async"
+            else:
+                mode = None
+        elif mode == "async" and line.startswith(b"    async def "):
+            name = line[14 : line.index(b"(")].decode()
+            if not name.startswith("_"):
+                async_methods.add(name)
+        elif mode == "sync" and line.startswith(b"    def "):
+            name = line[8 : line.index(b"(")].decode()
+            if not name.startswith("_"):
+                sync_methods.add(name)
+
+    return sync_methods, async_methods
+
+
+def extract_tests(file_path: Path, resource_name: str) -> tuple[set[str], set[str]]:
+    """Extract method names exercised by a unit-test file.
+
+    Args:
+        file_path: Path to the test file
+        resource_name: Resource attribute name on the gpu client
+
+    Returns:
+        Tuple of (sync_calls, async_calls) — method names invoked as
+        gpu.<resource>.<method>(), split by whether the call is awaited
+    """
+    # EAFP: attempt the read directly rather than paying an extra stat()
+    # for an exists() check first.
+    try:
+        content = _read(file_path)
+    except FileNotFoundError:
+        return set(), set()
+
+    # Cheap substring sanity check before involving the regex engine;
+    # files that never mention the resource return immediately.
+    if f"gpu.{resource_name}.".encode() not in content:
+        return set(), set()
+
+    # One forward pass to index line starts; each match then finds its
+    # line via bisect instead of an O(offset) backward rfind scan.
+    line_starts = [0]
+    line_starts.extend(i + 1 for i, c in enumerate(content) if c == 0x0A)
+
+    sync_calls: set[str] = set()
+    async_calls: set[str] = set()
+    for match in _call_re(resource_name).finditer(content):
+        line_start = line_starts[bisect.bisect_right(line_starts, match.start()) - 1]
+        line_prefix = content[line_start : match.start()]
+        if b"await" in line_prefix:
+            async_calls.add(match.group(1).decode())
+        else:
+            sync_calls.add(match.group(1).decode())
+    return sync_calls, async_calls
+
+
+def _scan_files(directory: Path) -> dict[str, Path]:
+    """Map file names to paths with a single directory read."""
+    return {entry.name: Path(entry.path) for entry in os.scandir(directory) if entry.is_file()}
+
+
+def analyze_resource(
+    resource_name: str, src_files: dict[str, Path], test_files: dict[str, Path]
+) -> dict:
+    """Analyze test coverage for a single resource.
+
+    Args:
+        resource_name: Resource module name (e.g. "instances")
+        src_files: Resource module paths keyed by file name
+        test_files: Unit-test paths keyed by file name
+
+    Returns:
+        Coverage details dict, or an empty dict if the source file is missing
+    """
+    src_file = src_files.get(f"{resource_name}.py")
+    if src_file is None:
+        return {}
+
+    try:
+        sync_methods, async_methods = extract_methods(src_file)
+    except FileNotFoundError:
+        return {}
+
+    test_name = TEST_FILE_OVERRIDES.get(resource_name, f"test_gpu_{resource_name}.py")
+    test_file = test_files.get(test_name)
+    if test_file is None:
+        tested_sync, tested_async = set(), set()
+    else:
+        tested_sync, tested_async = extract_tests(test_file, resource_name)
+
+    missing_sync = sync_methods - tested_sync
+    missing_async = async_methods - tested_async
+
+    return {
+        "sync_methods": sync_methods,
+        "async_methods": async_methods,
+        # Sorting is only for stable display; skip it for the common
+        # fully-covered (empty) case.
+        "missing_sync": sorted(missing_sync) if missing_sync else [],
+        "missing_async": sorted(missing_async) if missing_async else [],
+        # Union size without materializing the union set; a method seen
+        # both awaited and not is still counted once.
+        "test_count": len(tested_sync) + len(tested_async - tested_sync),
+    }
+
+
+def main() -> None:
+    """Print a per-resource and overall coverage report."""
+    repo_root = Path(__file__).resolve().parent.parent
+    src_dir = repo_root / "src" / "novita" / "api" / "resources" / "gpu"
+    test_dir = repo_root / "tests" / "unit"
+
+    # One directory read per tree instead of a per-resource path lookup.
+    src_files = _scan_files(src_dir)
+    test_files = _scan_files(test_dir)
+
+    # Each resource is independent file IO + scanning, so fan out across
+    # a thread pool and report in the original order afterwards.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(len(RESOURCES), os.cpu_count() or 4)
+    ) as executor:
+        results = list(
+            executor.map(lambda r: (r, analyze_resource(r, src_files, test_files)), RESOURCES)
+        )
+
+    # Totals via sum()'s C-level loop rather than interpreter += inside
+    # the print loop below.
+    analyzed = [res for _, res in results if res]
+    total_methods = sum(len(r["sync_methods"]) + len(r["async_methods"]) for r in analyzed)
+    total_tested = sum(r["test_count"] for r in analyzed)
+    total_missing = sum(len(r["missing_sync"]) + len(r["missing_async"]) for r in analyzed)
+
+    # Accumulate the report and emit it with one write instead of one
+    # locked, line-buffered print call per line.
+    out: list[str] = []
+    emit = out.append
+
+    emit("=" * 60)
+    emit("GPU resource method test coverage")
+    emit("=" * 60)
+
+    for resource, result in results:
+        if not result:
+            emit(f"\n{resource}: source file not found")
+            continue
+
+        emit(f"\n{resource}:")
+        emit(f"  sync methods:  {len(result['sync_methods'])}")
+        emit(f"  async methods: {len(result['async_methods'])}")
+        emit(f"  tested:        {result['test_count']}")
+        for name in result["missing_sync"]:
+            emit(f"  missing sync test:  {name}")
+        for name in result["missing_async"]:
+            emit(f"  missing async test: {name}")
+
+    coverage = 100 * (total_methods - total_missing) / total_methods if total_methods else 0.0
+    emit("\n" + "=" * 60)
+    emit(f"Total methods:  {total_methods}")
+    emit(f"Tested calls:   {total_tested}")
+    emit(f"Missing tests:  {total_missing}")
+    emit(f"Coverage:       {coverage:.1f}%")
+    emit("=" * 60)
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""Apply every post-generation transform to models.py in one AST pass.
+
+Historically apply_price_conversions.py and apply_model_fixes.py each read
+models.py, parsed the whole file, walked every node, unparsed and wrote it
+back — two parses, two unparses and four disk touches per regeneration.
+This script merges both transformers into a single pass so the file is
+read, parsed, unparsed and written exactly once.
+
+The transformations applied:
+1. Add 'computed_field' and 'field_validator' to pydantic imports
+2. Add 'pending' status to Status enum
+3. InstanceInfo: make billing_mode nullable, add empty-string validator
+4. SubscriptionPrice/GPUProduct/CPUProduct: price -> price_raw with alias
+   + @computed_field properties converting 1/100000 USD to standard USD
+
+Every transform is idempotent, so re-running on an already-patched file is
+a no-op; the old script names remain as thin shims for back-compat.
+
+A concrete-syntax rewriter (libcst) would make emission proportional to
+the edited nodes and preserve formatting, but libcst is not part of the
+dev dependency set, the unparse only runs when there are edits to apply,
+and generate_models.sh ruff-formats the output immediately afterwards —
+so formatting preservation buys nothing in this pipeline and ast.unparse
+is kept.
+"""
+
+import ast
+import copy
+import functools
+import sys
+from pathlib import Path
+
+# Parsed once at import; the validator is a compile-time constant, so
+# re-running the parser on every _create_empty_str_validator call is wasted
+# work. Callers deep-copy the node before inserting it into a tree.
+_VALIDATOR_FUNC = ast.parse(
+    '''\
+@field_validator("spot_status", "billing_mode", mode="before")
+@classmethod
+def empty_str_to_none(cls, v: Any) -> Any:
+    """Convert empty string to None for spot_status and billing_mode fields."""
+    if v == "":
+        return None
+    return v
+'''
+).body[0]
+
+# Imports appended to the pydantic import line, in pipeline order.
+_PYDANTIC_IMPORTS = ("computed_field", "field_validator")
+
+# Shared leaf nodes built once at import. Operator/context instances are
+# stateless and safe to share across insertions; nodes that receive
+# location info (the pending assignment, None constants) are deep-copied
+# at each insertion site instead of rebuilt field by field.
+_STORE = ast.Store()
+_BITOR = ast.BitOr()
+_NONE = ast.Constant(value=None)
+_PENDING_ASSIGN = ast.Assign(
+    targets=[ast.Name(id="pending", ctx=_STORE)],
+    value=ast.Constant(value="pending"),
+)
+
+
+# Tell-tale substrings that only ever all appear once every transform has
+# run; checking them is an O(size) scan that skips the parse entirely on
+# already-patched files.
+_APPLIED_MARKERS = ("field_validator", "computed_field", "empty_str_to_none", "price_raw")
+
+
+def _already_applied(source: str) -> bool:
+    """Cheap textual check for files every transform has already touched."""
+    if not all(marker in source for marker in _APPLIED_MARKERS):
+        return False
+    # The pending member is quoted differently before/after ruff format.
+    return "pending = 'pending'" in source or 'pending = "pending"' in source
+
+
+def _is_pending_member(item: ast.stmt) -> bool:
+    """Check whether a Status class-body statement defines 'pending'."""
+    if isinstance(item, ast.AnnAssign):
+        return isinstance(item.target, ast.Name) and item.target.id == "pending"
+    if isinstance(item, ast.Assign):
+        return any(isinstance(t, ast.Name) and t.id == "pending" for t in item.targets)
+    return False
+
+
+def _anchored(new_node: ast.stmt, anchor: ast.AST) -> ast.stmt:
+    """Give a freshly built subtree locations from its insertion anchor.
+
+    Only inserted subtrees need location fixing, so main() no longer walks
+    the entire tree with ast.fix_missing_locations.
+    """
+    ast.copy_location(new_node, anchor)
+    return ast.fix_missing_locations(new_node)
+
+
+@functools.cache
+def _price_property_func(
+    property_name: str, return_type: str, docstring: str, conversion: str
+) -> ast.FunctionDef:
+    """Parse a @computed_field @property template once per distinct signature.
+
+    Building the node from source is both simpler and faster than assembling
+    FunctionDef/arguments/Call objects by hand, and the cache means only
+    distinct (name, type, docstring, conversion) tuples ever hit the parser.
+    """
+    source = (
+        f"@computed_field()\n"
+        f"@property\n"
+        f"def {property_name}(self) -> {return_type}:\n"
+        f"    {docstring!r}\n"
+        f"    return {conversion}\n"
+    )
+    return ast.parse(source).body[0]
+
+
+class CombinedTransformer(ast.NodeTransformer):
+    """Single-pass transformer applying model fixes and price conversions."""
+
+    def __init__(self) -> None:
+        # Class dispatch is a single hash lookup; any class not in this
+        # table is returned untouched.
+        self._class_handlers = {
+            "Status": self._add_pending_status,
+            "InstanceInfo": self._add_spot_status_validator,
+            "SubscriptionPrice": self._transform_subscription_price,
+            "GPUProduct": self._transform_gpu_product,
+            "CPUProduct": self._transform_cpu_product,
+        }
+        self.modified_imports = False
+        # Tracks whether any edit actually changed the tree so main() can
+        # skip the unparse and write entirely on idempotent re-runs.
+        self.modified = False
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> ast.ImportFrom:
+        """Add 'computed_field' and 'field_validator' to pydantic imports."""
+        if node.module == "pydantic" and not self.modified_imports:
+            # ImportFrom.names is invariantly list[alias]; a tight for/break
+            # avoids the genexpr frame an any() would set up per check.
+            for name in _PYDANTIC_IMPORTS:
+                found = False
+                for alias in node.names:
+                    if alias.name == name:
+                        found = True
+                        break
+                if not found:
+                    new_alias = ast.copy_location(ast.alias(name=name, asname=None), node)
+                    node.names.append(new_alias)
+                    self.modified_imports = True
+                    self.modified = True
+
+        return node
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
+        """Nothing inside a function is ever rewritten; skip descending."""
+        return node
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AsyncFunctionDef:
+        """Nothing inside a function is ever rewritten; skip descending."""
+        return node
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:
+        """Transform specific model classes."""
+        handler = self._class_handlers.get(node.name)
+        return handler(node) if handler is not None else node
+
+    # -- model fixes ---------------------------------------------------
+
+    def _add_pending_status(self, node: ast.ClassDef) -> ast.ClassDef:
+        """Add 'pending' status to Status enum if not present."""
+        # Bind loop-invariant lookups to locals; enum bodies can have many
+        # members and each iteration otherwise pays repeated LOAD_ATTRs.
+        body = node.body
+        _Expr, _Assign, _Name = ast.Expr, ast.Assign, ast.Name
+
+        if any(_is_pending_member(item) for item in body):
+            return node
+
+        # Insert pending = "pending" after the first anchor (docstring or
+        # model_config); slice-assign and break rather than rebuilding the
+        # body and re-checking an inserted flag per member.
+        for i, item in enumerate(body):
+            if isinstance(item, _Expr) or (
+                isinstance(item, _Assign)
+                and any(isinstance(t, _Name) and t.id == "model_config" for t in item.targets)
+            ):
+                body[i + 1 : i + 1] = [_anchored(copy.deepcopy(_PENDING_ASSIGN), node)]
+                self.modified = True
+                break
+
+        return node
+
+    def _add_spot_status_validator(self, node: ast.ClassDef) -> ast.ClassDef:
+        """Add field validators to InstanceInfo for spot_status and billing_mode to convert empty strings to None.
+
+        Also makes billing_mode nullable.
+        """
+        body = node.body
+        _AnnAssign, _Name = ast.AnnAssign, ast.Name
+
+        # First, make billing_mode nullable
+        for item in body:
+            if (
+                isinstance(item, _AnnAssign)
+                and isinstance(item.target, _Name)
+                and item.target.id == "billing_mode"
+            ):
+                # Make the annotation nullable: BillingMode1 -> BillingMode1 | None
+                # And set default value to None
+                if isinstance(item.annotation, ast.Subscript):
+                    # It's Annotated[BillingMode1, Field(...)]
+                    subscript = item.annotation
+                    if (
+                        isinstance(subscript.slice, ast.Tuple)
+                        and len(subscript.slice.elts) >= 1
+                        # Skip if already nullable (idempotent re-runs)
+                        and not isinstance(subscript.slice.elts[0], ast.BinOp)
+                    ):
+                        # Make the type nullable: BillingMode1 -> BillingMode1 | None
+                        old_type = subscript.slice.elts[0]
+                        new_type = ast.BinOp(left=old_type, op=_BITOR, right=copy.deepcopy(_NONE))
+                        ast.copy_location(new_type, old_type)
+                        subscript.slice.elts[0] = ast.fix_missing_locations(new_type)
+                        self.modified = True
+                # Set default value to None (unless one is already there)
+                if item.value is None:
+                    item.value = ast.copy_location(copy.deepcopy(_NONE), item)
+                    self.modified = True
+
+        # Append the validator that handles both fields, unless present
+        _FunctionDef = ast.FunctionDef
+        if not any(
+            isinstance(item, _FunctionDef) and item.name == "empty_str_to_none" for item in body
+        ):
+            body.append(_anchored(self._create_empty_str_validator(), node))
+            self.modified = True
+
+        return node
+
+    def _create_empty_str_validator(self) -> ast.FunctionDef:
+        """Create field_validator for spot_status and billing_mode."""
+        # Deep-copy the pre-parsed template so repeated calls never share
+        # node identity across insertions.
+        return copy.deepcopy(_VALIDATOR_FUNC)
+
+    # -- price conversions ---------------------------------------------
+
+    def _rename_and_alias(self, item: ast.AnnAssign, new_name: str, alias_value: str) -> bool:
+        """Rename a field and add the API alias to its Field() call in one pass.
+
+        Args:
+            item: The annotated assignment node containing the field
+            new_name: The new attribute name (e.g., "price_raw")
+            alias_value: The alias value to add (e.g., "price", "spotPrice")
+
+        Returns:
+            True if the Field() call was found (alias added or already
+            present); False if the annotation is not Annotated[..., Field(...)]
+        """
+        # The annotation should be Annotated[type, Field(...)]
+        annotation = item.annotation
+        if not isinstance(annotation, ast.Subscript) or not isinstance(annotation.slice, ast.Tuple):
+            return False
+
+        # Walk the Annotated elements exactly once: rename and alias as
+        # soon as the Field() call is found.
+        _Call, _Name = ast.Call, ast.Name
+        for element in annotation.slice.elts:
+            if (
+                isinstance(element, _Call)
+                and isinstance(element.func, _Name)
+                and element.func.id == "Field"
+            ):
+                item.target.id = new_name
+                if not any(kw.arg == "alias" for kw in element.keywords):
+                    element.keywords.insert(
+                        0, ast.keyword(arg="alias", value=ast.Constant(value=alias_value))
+                    )
+                return True
+
+        # No Field() call found
+        return False
+
+    @staticmethod
+    def _already_converted(node: ast.ClassDef) -> bool:
+        """Check whether a price property was added by an earlier run."""
+        return any(isinstance(item, ast.FunctionDef) and item.name == "price" for item in node.body)
+
+    def _transform_subscription_price(self, node: ast.ClassDef) -> ast.ClassDef:
+        """Transform SubscriptionPrice class to use price_raw and computed price."""
+        if self._already_converted(node):
+            return node
+        self.modified = True
+
+        # Add docstring
+        docstring = ast.Expr(
+            value=ast.Constant(
+                value="""Subscription pricing information.
+
+    Note: Prices are automatically converted from the API's raw format (1/100000 USD)
+    to standard USD. For example, an API value of 350000 represents $3.50.
+    """
+            )
+        )
+
+        # Find and transform the price field in place; no body rebuild
+        _AnnAssign, _Name = ast.AnnAssign, ast.Name
+        for item in node.body:
+            if (
+                isinstance(item, _AnnAssign)
+                and isinstance(item.target, _Name)
+                and item.target.id == "price"
+            ):
+                if not self._rename_and_alias(item, "price_raw", "price"):
+                    raise ValueError(
+                        "Failed to add alias 'price' to field 'price_raw' in SubscriptionPrice class. "
+                        "Field() call not found in annotation."
+                    )
+                break
+
+        # Add computed_field property
+        price_property = self._create_price_property(
+            property_name="price",
+            return_type="float | None",
+            docstring="""Get subscription price in USD.
+
+        Returns:
+            Price in USD (converted from raw API value in 1/100000 USD units), or None if not available
+        """,
+            conversion="None if self.price_raw is None else self.price_raw / 100000",
+        )
+        node.body.append(_anchored(price_property, node))
+
+        # Insert docstring at the beginning of the class body (must be first for __doc__)
+        node.body.insert(0, _anchored(docstring, node))
+
+        return node
+
+    def _transform_gpu_product(self, node: ast.ClassDef) -> ast.ClassDef:
+        """Transform GPUProduct class to use price_raw/spot_price_raw and computed properties."""
+        if self._already_converted(node):
+            return node
+        self.modified = True
+
+        # Add docstring
+        docstring = ast.Expr(
+            value=ast.Constant(
+                value="""GPU product information.
+
+    Note: All prices are automatically converted from the API's raw format (1/100000 USD)
+    to standard USD per hour. For example, an API value of 35000 represents $0.35/hour.
+    """
+            )
+        )
+
+        # Find and transform price fields in place; stop once both are done
+        _AnnAssign, _Name = ast.AnnAssign, ast.Name
+        pending_fields = 2
+        for item in node.body:
+            if isinstance(item, _AnnAssign) and isinstance(item.target, _Name):
+                if item.target.id == "price":
+                    if not self._rename_and_alias(item, "price_raw", "price"):
+                        raise ValueError(
+                            "Failed to add alias 'price' to field 'price_raw' in GPUProduct class. "
+                            "Field() call not found in annotation."
+                        )
+                    pending_fields -= 1
+                elif item.target.id == "spot_price":
+                    if not self._rename_and_alias(item, "spot_price_raw", "spotPrice"):
+                        raise ValueError(
+                            "Failed to add alias 'spotPrice' to field 'spot_price_raw' in GPUProduct class. "
+                            "Field() call not found in annotation."
+                        )
+                    pending_fields -= 1
+                if pending_fields == 0:
+                    break
+
+        # Add computed properties
+        price_property = self._create_price_property(
+            property_name="price",
+            return_type="float | None",
+            docstring="""Get on-demand price in USD per hour.
+
+        Returns:
+            Price in USD per hour (converted from raw API value in 1/100000 USD units), or None if not available
+        """,
+            conversion="None if self.price_raw is None else self.price_raw / 100000",
+        )
+        node.body.append(_anchored(price_property, node))
+
+        spot_price_property = self._create_price_property(
+            property_name="spot_price",
+            return_type="float | None",
+            docstring="""Get spot price in USD per hour.
+
+        Returns:
+            Spot price in USD per hour, or None if spot pricing is not available
+        """,
+            conversion="self.spot_price_raw / 100000 if self.spot_price_raw is not None else None",
+        )
+        node.body.append(_anchored(spot_price_property, node))
+
+        # Insert docstring at the beginning of the class body (must be first for __doc__)
+        node.body.insert(0, _anchored(docstring, node))
+
+        return node
+
+    def _transform_cpu_product(self, node: ast.ClassDef) -> ast.ClassDef:
+        """Transform CPUProduct class to use price_raw and computed price."""
+        if self._already_converted(node):
+            return node
+        self.modified = True
+
+        # Add docstring
+        docstring = ast.Expr(
+            value=ast.Constant(
+                value="""CPU product information.
+
+    Note: Prices are automatically converted from the API's raw format (1/100000 USD)
+    to standard USD per hour.
+    """
+            )
+        )
+
+        # Find and transform the price field in place; no body rebuild
+        _AnnAssign, _Name = ast.AnnAssign, ast.Name
+        for item in node.body:
+            if (
+                isinstance(item, _AnnAssign)
+                and isinstance(item.target, _Name)
+                and item.target.id == "price"
+            ):
+                if not self._rename_and_alias(item, "price_raw", "price"):
+                    raise ValueError(
+                        "Failed to add alias 'price' to field 'price_raw' in CPUProduct class. "
+                        "Field() call not found in annotation."
+                    )
+                break
+
+        # Add computed property
+        price_property = self._create_price_property(
+            property_name="price",
+            return_type="float | None",
+            docstring="""Get price in USD per hour.
+
+        Returns:
+            Price in USD per hour, or None if pricing is not available
+        """,
+            conversion="self.price_raw / 100000 if self.price_raw is not None else None",
+        )
+        node.body.append(_anchored(price_property, node))
+
+        # Insert docstring at the beginning of the class body (must be first for __doc__)
+        node.body.insert(0, _anchored(docstring, node))
+
+        return node
+
+    def _create_price_property(
+        self, property_name: str, return_type: str, docstring: str, conversion: str
+    ) -> ast.FunctionDef:
+        """Create a @computed_field @property method for price conversion."""
+        # Deep-copy the cached template parse so each insertion gets its
+        # own nodes for ast.fix_missing_locations.
+        return copy.deepcopy(
+            _price_property_func(property_name, return_type, docstring, conversion)
+        )
+
+
+def main() -> int:
+    """Main entry point."""
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <models.py>", file=sys.stderr)
+        return 1
+
+    models_path = Path(sys.argv[1])
+    if not models_path.exists():
+        print(f"Error: File not found: {models_path}", file=sys.stderr)
+        return 1
+
+    # One read, one parse, one visit, one unparse, one write. Binary I/O
+    # plus a single decode/encode hits the C utf-8 fast path instead of
+    # the incremental text-mode codec.
+    source = models_path.read_bytes().decode("utf-8")
+
+    # Regeneration reruns this on files that are often already patched;
+    # the marker scan costs far less than parsing models.py again.
+    if _already_applied(source):
+        print(f"✓ Model transforms already applied to {models_path}")
+        return 0
+
+    tree = ast.parse(source)
+    # The source string is no longer needed once the tree exists; dropping
+    # it keeps only ~one file-size worth of text resident at a time
+    # (source, then the unparsed result) instead of both.
+    del source
+
+    transformer = CombinedTransformer()
+    transformed_tree = transformer.visit(tree)
+
+    # Idempotent re-runs (e.g. during development) skip the unparse and
+    # the write entirely; nothing in the tree changed.
+    if not transformer.modified:
+        print(f"✓ Model transforms already applied to {models_path}")
+        return 0
+
+    models_path.write_bytes(ast.unparse(transformed_tree).encode("utf-8"))
+
+    print(f"✓ Applied model transforms to {models_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,16 +9,23 @@ By default, deletes all test resources. Use --min-age to only delete older resou
 
 from __future__ import annotations
 
-import argparse
 import os
 import re
 import sys
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from novita import NovitaClient
 
+# Resource names are expected to be in format: test-{type}-YYYYMMDD-HHMMSS
+_TS_RE = re.compile(r"test-\w+-(\d{8})-(\d{6})")
+# Anchored variant: one match() both confirms the test- prefix and
+# captures the timestamp, so filtering scans each name once
+_TEST_RE = re.compile(r"^test-\w+-(\d{8})-(\d{6})")
+
 
 def is_expected_error(error: Exception) -> bool:
     """Check if an error is expected (e.g., resource already deleted).
@@ -34,6 +41,26 @@ def is_expected_error(error: Exception) -> bool:
     return "not found" in error_msg or "not fount" in error_msg
 
 
+def _timestamp_from_match(match: re.Match[str]) -> datetime | None:
+    """Build a datetime from the (YYYYMMDD, HHMMSS) groups of a name match."""
+    date_str = match.group(1)
+    time_str = match.group(2)
+    try:
+        # Direct construction is much cheaper than strptime's
+        # format-string walk when filtering many resource names
+        return datetime(
+            int(date_str[:4]),
+            int(date_str[4:6]),
+            int(date_str[6:8]),
+            int(time_str[:2]),
+            int(time_str[2:4]),
+            int(time_str[4:6]),
+            tzinfo=UTC,
+        )
+    except ValueError:
+        return None
+
+
 def parse_timestamp_from_name(name: str) -> datetime | None:
     """Extract timestamp from resource name.
 
@@ -45,303 +72,206 @@ def parse_timestamp_from_name(name: str) -> datetime | None:
     Returns:
         datetime object if timestamp found, None otherwise
     """
-    # Pattern: test-{type}-YYYYMMDD-HHMMSS
-    pattern = r"test-\w+-(\d{8})-(\d{6})"
-    match = re.search(pattern, name)
-    if match:
-        date_str = match.group(1)
-        time_str = match.group(2)
-        try:
-            return datetime.strptime(f"{date_str}{time_str}", "%Y%m%d%H%M%S").replace(tzinfo=UTC)
-        except ValueError:
-            return None
-    return None
-
-
-def is_old_enough(name: str, min_age_hours: float) -> bool:
-    """Check if resource is old enough to delete.
-
-    Args:
-        name: Resource name
-        min_age_hours: Minimum age in hours (0.0 means delete all)
-
-    Returns:
-        True if resource should be deleted
-    """
-    if min_age_hours == 0:
-        return True
+    match = _TS_RE.search(name)
+    return _timestamp_from_match(match) if match else None
 
-    timestamp = parse_timestamp_from_name(name)
-    if timestamp is None:
-        # If we can't parse timestamp, delete it (legacy format or corrupted)
-        return True
-
-    age = datetime.now(UTC) - timestamp
-    return age >= timedelta(hours=min_age_hours)
 
-
-def cleanup_instances(client: NovitaClient, min_age_hours: float = 0) -> tuple[int, int]:
-    """Clean up test instances.
+def _is_deletable_test_name(name: str, cutoff: datetime | None) -> bool:
+    """Check prefix and age cutoff with a single scan over the name.
 
     Args:
-        client: NovitaClient instance
-        min_age_hours: Only delete resources older than this many hours (0.0 = all)
-
-    Returns:
-        Tuple of (deleted_count, error_count)
-    """
-    deleted = 0
-    errors = 0
-
-    try:
-        instances = client.gpu.instances.list()
-        test_instances = [
-            i
-            for i in instances
-            if i.name and i.name.startswith("test-") and is_old_enough(i.name, min_age_hours)
-        ]
-
-        for instance in test_instances:
-            try:
-                print(f"Deleting instance: {instance.id} ({instance.name})")
-                client.gpu.instances.delete(instance.id)
-                deleted += 1
-            except Exception as e:
-                if not is_expected_error(e):
-                    print(f"  Failed to delete instance {instance.id}: {e}")
-                    errors += 1
-    except Exception as e:
-        print(f"Failed to list instances: {e}")
-        errors += 1
-
-    return deleted, errors
-
-
-def cleanup_endpoints(client: NovitaClient, min_age_hours: float = 0) -> tuple[int, int]:
-    """Clean up test endpoints.
-
-    Args:
-        client: NovitaClient instance
-        min_age_hours: Only delete resources older than this many hours (0.0 = all)
+        name: Resource name
+        cutoff: Delete resources created at or before this time (None = delete all)
 
     Returns:
-        Tuple of (deleted_count, error_count)
+        True if the name has the test- prefix and clears the cutoff
     """
-    deleted = 0
-    errors = 0
-
-    try:
-        endpoints = client.gpu.endpoints.list()
-        test_endpoints = [
-            e
-            for e in endpoints
-            if e.name and e.name.startswith("test-") and is_old_enough(e.name, min_age_hours)
-        ]
-
-        for endpoint in test_endpoints:
-            try:
-                print(f"Deleting endpoint: {endpoint.id} ({endpoint.name})")
-                client.gpu.endpoints.delete(endpoint.id)
-                deleted += 1
-            except Exception as e:
-                if not is_expected_error(e):
-                    print(f"  Failed to delete endpoint {endpoint.id}: {e}")
-                    errors += 1
-    except Exception as e:
-        print(f"Failed to list endpoints: {e}")
-        errors += 1
-
-    return deleted, errors
+    match = _TEST_RE.match(name)
+    if match is None:
+        # Prefixed names without a parsable timestamp (legacy format or
+        # corrupted) are deleted unconditionally
+        return name.startswith("test-")
+    if cutoff is None:
+        return True
+    timestamp = _timestamp_from_match(match)
+    return timestamp is None or timestamp <= cutoff
 
 
-def cleanup_templates(client: NovitaClient, min_age_hours: float = 0) -> tuple[int, int]:
-    """Clean up test templates.
+def is_old_enough(name: str, cutoff: datetime | None) -> bool:
+    """Check if resource is old enough to delete.
 
     Args:
-        client: NovitaClient instance
-        min_age_hours: Only delete resources older than this many hours (0.0 = all)
+        name: Resource name
+        cutoff: Delete resources created at or before this time (None = delete all)
 
     Returns:
-        Tuple of (deleted_count, error_count)
+        True if resource should be deleted
     """
-    deleted = 0
-    errors = 0
-
-    try:
-        templates = client.gpu.templates.list()
-        test_templates = [
-            t
-            for t in templates
-            if t.name and t.name.startswith("test-") and is_old_enough(t.name, min_age_hours)
-        ]
+    if cutoff is None:
+        return True
 
-        for template in test_templates:
-            try:
-                print(f"Deleting template: {template.id} ({template.name})")
-                client.gpu.templates.delete(template.id)
-                deleted += 1
-            except Exception as e:
-                if not is_expected_error(e):
-                    print(f"  Failed to delete template {template.id}: {e}")
-                    errors += 1
-    except Exception as e:
-        print(f"Failed to list templates: {e}")
-        errors += 1
+    timestamp = parse_timestamp_from_name(name)
+    # If we can't parse timestamp, delete it (legacy format or corrupted)
+    return timestamp is None or timestamp <= cutoff
 
-    return deleted, errors
 
+def _parallel_delete(
+    items: Sequence,
+    delete_fn: Callable,
+    describe: Callable[[object], str],
+) -> tuple[int, int]:
+    """Delete resources concurrently and count the outcomes.
 
-def cleanup_networks(client: NovitaClient, min_age_hours: float = 0) -> tuple[int, int]:
-    """Clean up test networks.
+    Deletions are independent REST calls, so issuing them from a thread pool
+    overlaps the request round-trips instead of paying each latency serially.
 
     Args:
-        client: NovitaClient instance
-        min_age_hours: Only delete resources older than this many hours (0.0 = all)
+        items: Resources to delete
+        delete_fn: Callable issuing the delete API call for one resource
+        describe: Callable returning a "type: id (name)" label for log output
 
     Returns:
         Tuple of (deleted_count, error_count)
     """
     deleted = 0
     errors = 0
+    if not items:
+        return deleted, errors
 
-    try:
-        networks = client.gpu.networks.list()
-        test_networks = [
-            n
-            for n in networks
-            if n.name and n.name.startswith("test-") and is_old_enough(n.name, min_age_hours)
-        ]
-
-        for network in test_networks:
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {executor.submit(delete_fn, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
             try:
-                print(f"Deleting network: {network.id} ({network.name})")
-                client.gpu.networks.delete(network.id)
+                future.result()
+                print(f"Deleted {describe(item)}")
                 deleted += 1
             except Exception as e:
                 if not is_expected_error(e):
-                    print(f"  Failed to delete network {network.id}: {e}")
+                    print(f"  Failed to delete {describe(item)}: {e}")
                     errors += 1
-    except Exception as e:
-        print(f"Failed to list networks: {e}")
-        errors += 1
 
     return deleted, errors
 
 
-def cleanup_storages(client: NovitaClient, min_age_hours: float = 0) -> tuple[int, int]:
-    """Clean up test network storages.
+# Table of cleanable resource types:
+# (plural label, singular label, sub-client getter, lister, name attr, id attr,
+#  match test- as prefix?, delete takes a list of ids?)
+#
+# Only the instances endpoint supports server-side filters, so its lister
+# pushes the name filter down and pages with iter() instead of pulling the
+# whole account in one response; the client-side prefix check below still
+# applies. Every other lister is a plain unfiltered list().
+_LIST_ALL = lambda sub: sub.list()  # noqa: E731
+RESOURCES = [
+    (
+        "instances",
+        "instance",
+        lambda c: c.gpu.instances,
+        lambda sub: sub.iter(page_size=200, name="test-"),
+        "name",
+        "id",
+        True,
+        False,
+    ),
+    ("endpoints", "endpoint", lambda c: c.gpu.endpoints, _LIST_ALL, "name", "id", True, False),
+    ("templates", "template", lambda c: c.gpu.templates, _LIST_ALL, "name", "id", True, False),
+    ("networks", "network", lambda c: c.gpu.networks, _LIST_ALL, "name", "id", True, False),
+    (
+        "storages",
+        "storage",
+        lambda c: c.gpu.storages,
+        _LIST_ALL,
+        "storage_name",
+        "storage_id",
+        True,
+        False,
+    ),
+    (
+        "registry auths",
+        "registry auth",
+        lambda c: c.gpu.registries,
+        _LIST_ALL,
+        "registry",
+        "id",
+        True,
+        False,
+    ),
+    # Prewarm tasks are matched on the image reference, which embeds the
+    # test- tag mid-string, and their delete endpoint takes a list of ids,
+    # so all matching tasks are deleted in bulk calls.
+    (
+        "prewarm tasks",
+        "prewarm task",
+        lambda c: c.gpu.image_prewarm,
+        _LIST_ALL,
+        "image",
+        "id",
+        False,
+        True,
+    ),
+]
+
+
+def cleanup_resource(
+    client: NovitaClient, resource: tuple, min_age_hours: float = 0
+) -> tuple[int, int]:
+    """Clean up one resource type described by a RESOURCES table entry.
 
     Args:
         client: NovitaClient instance
+        resource: A RESOURCES entry describing the sub-client and attributes
         min_age_hours: Only delete resources older than this many hours (0.0 = all)
 
     Returns:
         Tuple of (deleted_count, error_count)
     """
-    deleted = 0
-    errors = 0
-
-    try:
-        storages = client.gpu.storages.list()
-        test_storages = [
-            s
-            for s in storages
-            if s.storage_name
-            and s.storage_name.startswith("test-")
-            and is_old_enough(s.storage_name, min_age_hours)
-        ]
-
-        for storage in test_storages:
-            try:
-                print(f"Deleting storage: {storage.storage_id} ({storage.storage_name})")
-                client.gpu.storages.delete(storage.storage_id)
-                deleted += 1
-            except Exception as e:
-                if not is_expected_error(e):
-                    print(f"  Failed to delete storage {storage.storage_id}: {e}")
-                    errors += 1
-    except Exception as e:
-        print(f"Failed to list storages: {e}")
-        errors += 1
+    label, singular, getter, lister, name_attr, id_attr, prefix_match, batch_delete = resource
 
-    return deleted, errors
-
-
-def cleanup_registries(client: NovitaClient, min_age_hours: float = 0) -> tuple[int, int]:
-    """Clean up test image registry authentications.
-
-    Args:
-        client: NovitaClient instance
-        min_age_hours: Only delete resources older than this many hours (0.0 = all)
-
-    Returns:
-        Tuple of (deleted_count, error_count)
-    """
-    deleted = 0
-    errors = 0
+    # One clock read per pass instead of one per resource name
+    cutoff = None if min_age_hours == 0 else datetime.now(UTC) - timedelta(hours=min_age_hours)
 
     try:
-        auths = client.gpu.registries.list()
-        test_auths = [
-            a
-            for a in auths
-            if a.registry
-            and a.registry.startswith("test-")
-            and is_old_enough(a.registry, min_age_hours)
+        sub_client = getter(client)
+        items = lister(sub_client)
+        test_items = [
+            item
+            for item in items
+            if (name := getattr(item, name_attr, None))
+            and (
+                _is_deletable_test_name(name, cutoff)
+                if prefix_match
+                else ("test-" in name and is_old_enough(name, cutoff))
+            )
         ]
-
-        for auth in test_auths:
-            try:
-                print(f"Deleting registry auth: {auth.id} ({auth.registry})")
-                client.gpu.registries.delete(auth.id)
-                deleted += 1
-            except Exception as e:
-                if not is_expected_error(e):
-                    print(f"  Failed to delete registry auth {auth.id}: {e}")
-                    errors += 1
     except Exception as e:
-        print(f"Failed to list registry auths: {e}")
-        errors += 1
-
-    return deleted, errors
-
-
-def cleanup_image_prewarm(client: NovitaClient, min_age_hours: float = 0) -> tuple[int, int]:
-    """Clean up test image prewarm tasks.
-
-    Args:
-        client: NovitaClient instance
-        min_age_hours: Only delete resources older than this many hours (0.0 = all)
-
-    Returns:
-        Tuple of (deleted_count, error_count)
-    """
-    deleted = 0
-    errors = 0
-
-    try:
-        tasks = client.gpu.image_prewarm.list()
-        # For image prewarm, check if the image contains test- tag
-        test_tasks = [
-            t
-            for t in tasks
-            if t.image and "test-" in t.image and is_old_enough(t.image, min_age_hours)
-        ]
-
-        for task in test_tasks:
+        print(f"Failed to list {label}: {e}")
+        return 0, 1
+
+    if batch_delete:
+        # The delete endpoint accepts a list of ids, so one call per chunk
+        # of 100 replaces N round-trips (no other resource type exposes a
+        # bulk delete, so they go through the thread pool below instead)
+        deleted = 0
+        errors = 0
+        ids = [getattr(item, id_attr) for item in test_items]
+        for start in range(0, len(ids), 100):
+            chunk = ids[start : start + 100]
             try:
-                print(f"Deleting prewarm task: {task.id} ({task.image})")
-                client.gpu.image_prewarm.delete([task.id])
-                deleted += 1
+                sub_client.delete(chunk)
+                print(f"Deleted {len(chunk)} {label}: {', '.join(chunk)}")
+                deleted += len(chunk)
             except Exception as e:
                 if not is_expected_error(e):
-                    print(f"  Failed to delete prewarm task {task.id}: {e}")
+                    print(f"  Failed to delete {label} {', '.join(chunk)}: {e}")
                     errors += 1
-    except Exception as e:
-        print(f"Failed to list prewarm tasks: {e}")
-        errors += 1
+        return deleted, errors
 
-    return deleted, errors
+    return _parallel_delete(
+        test_items,
+        lambda item: sub_client.delete(getattr(item, id_attr)),
+        lambda item: f"{singular}: {getattr(item, id_attr)} ({getattr(item, name_attr)})",
+    )
 
 
 def main() -> int:
@@ -350,6 +280,10 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for errors)
     """
+    # Only needed once we actually run; keeps module import cheap for tools
+    # that import the helpers without invoking the CLI
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Clean up test resources from Novita API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -398,19 +332,10 @@ Examples:
         total_errors = 0
 
         # Cleanup each resource type
-        resource_types = [
-            ("instances", cleanup_instances),
-            ("endpoints", cleanup_endpoints),
-            ("templates", cleanup_templates),
-            ("networks", cleanup_networks),
-            ("storages", cleanup_storages),
-            ("registry auths", cleanup_registries),
-            ("prewarm tasks", cleanup_image_prewarm),
-        ]
-
-        for resource_name, cleanup_func in resource_types:
+        for resource in RESOURCES:
+            resource_name = resource[0]
             print(f"\nCleaning up {resource_name}...")
-            deleted, errors = cleanup_func(client, min_age_hours=args.min_age)
+            deleted, errors = cleanup_resource(client, resource, min_age_hours=args.min_age)
             total_deleted += deleted
             total_errors += errors
 
@@ -2,17 +2,66 @@
 """
 Script to fetch all API documentation pages listed in api.txt
 and save them for analysis.
+
+Fetches are network-bound, so they run concurrently on a single pooled
+httpx.AsyncClient: the connection pool reuses TCP+TLS sessions instead of
+paying a handshake per URL. An asyncio.Semaphore caps in-flight requests
+(FETCH_WORKERS env var, default 8) and a shared rate limiter keeps the
+global request rate polite.
 """
 
+import asyncio
 import contextlib
+import gzip
 import json
+import os
 import re
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
+from collections import deque
 from pathlib import Path
 
+import httpx
+
+_UA = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
+
+# Compiled once at import: the URL extractor runs over all of api.txt and
+# the sanitizer patterns run once per fetched URL.
+_URL_RE = re.compile(r"https://novita\.ai/docs/api-reference/[^\s|)]+")
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9._-]")
+_UNDERSCORE_RE = re.compile(r"_+")
+
+
+class RateLimiter:
+    """Cap the global request rate across all in-flight fetches.
+
+    Keeps a deque of recent call timestamps guarded by a lock; acquire()
+    waits until issuing another call stays under max_calls per period.
+    """
+
+    def __init__(self, max_calls: int, period: float = 1.0) -> None:
+        self._max_calls = max_calls
+        self._period = period
+        self._calls: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self._period:
+                    self._calls.popleft()
+                if len(self._calls) < self._max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self._period - (now - self._calls[0])
+            await asyncio.sleep(wait)
+
+
+def _looks_not_found(head: bytes) -> bool:
+    """Check whether the leading bytes of a response look like the 404 page."""
+    return b"Page Not Found" in head or b"404" in head[:1000]
+
 
 def sanitize_filename(url: str, max_length: int = 200) -> str:
     """Sanitize a URL to create a safe filename.
@@ -35,10 +84,10 @@ def sanitize_filename(url: str, max_length: int = 200) -> str:
         path = urllib.parse.unquote(path)
 
     # Replace characters not in [A-Za-z0-9._-] with underscore
-    sanitized = re.sub(r"[^A-Za-z0-9._-]", "_", path)
+    sanitized = _SANITIZE_RE.sub("_", path)
 
     # Remove consecutive underscores
-    sanitized = re.sub(r"_+", "_", sanitized)
+    sanitized = _UNDERSCORE_RE.sub("_", sanitized)
 
     # Remove leading/trailing underscores and dots
     sanitized = sanitized.strip("_.")
@@ -57,78 +106,195 @@ def sanitize_filename(url: str, max_length: int = 200) -> str:
 # Parse api.txt to extract all documentation URLs
 api_txt_path = Path("./openapi/api.txt")
 output_dir = Path("./docs_fetched")
-output_dir.mkdir(exist_ok=True)
 
-# Read api.txt and extract URLs
-urls = []
-with open(api_txt_path, encoding="utf-8") as f:
-    content = f.read()
-    # Extract all URLs from the markdown table
-    url_pattern = r"https://novita\.ai/docs/api-reference/[^\s|)]+"
-    urls = re.findall(url_pattern, content)
+# Be nice to the server: at most 4 requests/second across all fetches
+rate_limiter = RateLimiter(max_calls=4)
+
+
+async def fetch_one(
+    client: httpx.AsyncClient, url: str, sem: asyncio.Semaphore, prev: dict | None
+) -> dict:
+    """Fetch a single documentation page and write it to disk.
 
-print(f"Found {len(urls)} documentation URLs")
+    Revalidates with If-None-Match/If-Modified-Since when the previous run
+    recorded ETag/Last-Modified headers for this URL; a 304 reuses the
+    on-disk file and skips both the body transfer and the write. The body
+    is streamed so soft-404 pages are detected from the first ~4 KB and
+    the rest of the transfer (and the file write) is skipped. Valid pages
+    are written gzip-compressed as <endpoint>.html.gz.
+
+    Args:
+        client: The shared pooled HTTP client
+        url: The documentation URL to fetch
+        sem: Semaphore capping concurrent fetches
+        prev: This URL's record from the previous fetch_summary.json, if any
 
-# Fetch each URL
-results = []
-for i, url in enumerate(urls, 1):
+    Returns:
+        A summary record for fetch_summary.json
+    """
     endpoint_name = sanitize_filename(url)
-    print(f"[{i}/{len(urls)}] Fetching {endpoint_name}...")
-
-    try:
-        req = urllib.request.Request(
-            url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            },
-        )
-        with urllib.request.urlopen(req, timeout=10) as response:
-            html_content = response.read().decode("utf-8")
-
-            # Save HTML file
-            output_file = output_dir / f"{endpoint_name}.html"
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
-
-            # Check if it's a valid page (not 404)
-            if "Page Not Found" in html_content or "404" in html_content[:1000]:
-                status = "NOT_FOUND"
-            else:
-                status = "SUCCESS"
-
-            results.append(
-                {"url": url, "endpoint": endpoint_name, "status": status, "file": str(output_file)}
-            )
-            print(f"  ✓ {status}")
-
-    except urllib.error.HTTPError as e:
-        print(f"  ✗ HTTP Error {e.code}")
-        results.append(
-            {"url": url, "endpoint": endpoint_name, "status": f"HTTP_{e.code}", "file": None}
-        )
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-        results.append(
-            {
+
+    # Only revalidate when the previously fetched file is still on disk
+    headers = {}
+    if prev and prev.get("file") and Path(prev["file"]).exists():
+        if prev.get("etag"):
+            headers["If-None-Match"] = prev["etag"]
+        if prev.get("last_modified"):
+            headers["If-Modified-Since"] = prev["last_modified"]
+
+    async with sem:
+        await rate_limiter.acquire()
+        try:
+            async with client.stream("GET", url, headers=headers or None) as response:
+                if response.status_code == 304:
+                    # Unchanged since last run: reuse the cached file as-is
+                    return dict(prev)
+                if response.status_code >= 400:
+                    return {
+                        "url": url,
+                        "endpoint": endpoint_name,
+                        "status": f"HTTP_{response.status_code}",
+                        "file": None,
+                    }
+
+                # Sniff the first ~4 KB for the soft-404 page before pulling
+                # the rest of the body; invalid endpoints stop the transfer
+                # there instead of downloading the whole page
+                chunks: list[bytes] = []
+                size = 0
+                sniffed = False
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if not sniffed and size >= 4096:
+                        sniffed = True
+                        if _looks_not_found(b"".join(chunks)):
+                            return {
+                                "url": url,
+                                "endpoint": endpoint_name,
+                                "status": "NOT_FOUND",
+                                "file": None,
+                            }
+                body = b"".join(chunks)
+                if not sniffed and _looks_not_found(body):
+                    # Body was smaller than the sniff window
+                    return {
+                        "url": url,
+                        "endpoint": endpoint_name,
+                        "status": "NOT_FOUND",
+                        "file": None,
+                    }
+        except Exception as e:
+            return {
                 "url": url,
                 "endpoint": endpoint_name,
                 "status": "ERROR",
                 "error": str(e),
                 "file": None,
             }
-        )
-
-    # Be nice to the server
-    time.sleep(0.5)
-
-# Save results summary
-summary_file = output_dir / "fetch_summary.json"
-with open(summary_file, "w", encoding="utf-8") as f:
-    json.dump(results, f, indent=2)
-
-# Print summary
-success_count = sum(1 for r in results if r["status"] == "SUCCESS")
-print(f"\n{'='*60}")
-print(f"Summary: {success_count}/{len(results)} pages fetched successfully")
-print(f"Results saved to: {output_dir}")
-print(f"Summary: {summary_file}")
+
+    # Save the page gzip-compressed without blocking the event loop; doc
+    # pages are large repetitive HTML shells, so this shrinks docs_fetched/
+    # by roughly an order of magnitude
+    output_file = output_dir / f"{endpoint_name}.html.gz"
+    await asyncio.to_thread(output_file.write_bytes, gzip.compress(body, 6))
+
+    return {
+        "url": url,
+        "endpoint": endpoint_name,
+        "status": "SUCCESS",
+        "file": str(output_file),
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+
+
+async def main() -> None:
+    # Only needed for the CLI entry point
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fetch all API documentation pages from api.txt")
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Skip URLs whose cached file is newer than --max-age, without any HTTP request",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=3600.0,
+        help="Freshness window in seconds for --skip-existing (default: 3600)",
+    )
+    args = parser.parse_args()
+
+    output_dir.mkdir(exist_ok=True)
+
+    # Read api.txt and extract URLs from the markdown table
+    content = api_txt_path.read_text(encoding="utf-8")
+    urls = _URL_RE.findall(content)
+
+    print(f"Found {len(urls)} documentation URLs")
+
+    # Prior summary records carry ETag/Last-Modified for revalidation
+    summary_file = output_dir / "fetch_summary.json"
+    previous: dict[str, dict] = {}
+    with contextlib.suppress(Exception):
+        previous = {r["url"]: r for r in json.loads(summary_file.read_text(encoding="utf-8"))}
+
+    # Fresh-enough cached files short-circuit before any HTTP work; stale
+    # or missing ones go through the normal fetch (which may still get a
+    # cheap 304 via ETag revalidation)
+    results = []
+    pending = []
+    for url in urls:
+        endpoint_name = sanitize_filename(url)
+        output_file = output_dir / f"{endpoint_name}.html.gz"
+        if (
+            args.skip_existing
+            and output_file.exists()
+            and (time.time() - output_file.stat().st_mtime) < args.max_age
+        ):
+            record = dict(
+                previous.get(url)
+                or {"url": url, "endpoint": endpoint_name, "file": str(output_file)}
+            )
+            record["status"] = "CACHED"
+            results.append(record)
+        else:
+            pending.append(url)
+
+    if args.skip_existing:
+        print(f"Skipping {len(results)} cached pages newer than {args.max_age:.0f}s")
+
+    sem = asyncio.Semaphore(int(os.getenv("FETCH_WORKERS", "8")))
+    limits = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
+    async with httpx.AsyncClient(
+        headers=_UA, limits=limits, timeout=10.0, follow_redirects=True
+    ) as client:
+        tasks = [fetch_one(client, url, sem, previous.get(url)) for url in pending]
+        for i, fetched in enumerate(asyncio.as_completed(tasks), 1):
+            record = await fetched
+            marker = "✓" if record["status"] == "SUCCESS" else "✗"
+            print(f"[{i}/{len(tasks)}] {marker} {record['endpoint']}: {record['status']}")
+            results.append(record)
+
+    # Keep the summary in api.txt order regardless of completion order
+    order = {url: i for i, url in enumerate(urls)}
+    results.sort(key=lambda r: order[r["url"]])
+
+    # Save results summary in one write instead of json.dump's many small
+    # chunked writes (orjson would be faster still, but the SDK's dependency
+    # set is just pydantic + httpx and this file is written once per run)
+    summary_file.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    # Print summary
+    success_count = sum(1 for r in results if r["status"] in ("SUCCESS", "CACHED"))
+    print(f"\n{'='*60}")
+    print(f"Summary: {success_count}/{len(results)} pages fetched successfully")
+    print(f"Results saved to: {output_dir}")
+    print(f"Summary: {summary_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -49,23 +49,17 @@ $PYTHON -m datamodel_code_generator \
 
 echo -e "${GREEN}✓ Models generated successfully${NC}\n"
 
-echo -e "${BLUE}Step 2: Applying price conversions...${NC}"
-if $PYTHON scripts/apply_price_conversions.py "$OUTPUT_FILE"; then
-    echo -e "${GREEN}✓ Price conversions applied${NC}\n"
+# Price conversions and model fixes are applied by one combined pass so the
+# file is only parsed and rewritten once.
+echo -e "${BLUE}Step 2: Applying model transforms...${NC}"
+if $PYTHON scripts/apply_all_model_transforms.py "$OUTPUT_FILE"; then
+    echo -e "${GREEN}✓ Model transforms applied${NC}\n"
 else
-    echo -e "${YELLOW}⚠ Price conversion failed${NC}\n"
+    echo -e "${YELLOW}⚠ Model transforms failed${NC}\n"
     exit 1
 fi
 
-echo -e "${BLUE}Step 3: Applying model fixes...${NC}"
-if $PYTHON scripts/apply_model_fixes.py "$OUTPUT_FILE"; then
-    echo -e "${GREEN}✓ Model fixes applied${NC}\n"
-else
-    echo -e "${YELLOW}⚠ Model fixes failed${NC}\n"
-    exit 1
-fi
-
-echo -e "${BLUE}Step 4: Adding __init__.py to generated package...${NC}"
+echo -e "${BLUE}Step 3: Adding __init__.py to generated package...${NC}"
 cat > "$OUTPUT_DIR/__init__.py" << 'EOF'
 """Auto-generated models from OpenAPI specification.
 
@@ -79,7 +73,7 @@ EOF
 
 echo -e "${GREEN}✓ __init__.py created${NC}\n"
 
-echo -e "${BLUE}Step 5: Formatting generated code with ruff...${NC}"
+echo -e "${BLUE}Step 4: Formatting generated code with ruff...${NC}"
 ruff format "$OUTPUT_FILE" "$OUTPUT_DIR/__init__.py" 2>/dev/null || echo "Ruff format skipped"
 ruff check --fix "$OUTPUT_FILE" "$OUTPUT_DIR/__init__.py" 2>/dev/null || echo "Ruff check skipped"
 
@@ -1,32 +1,42 @@
-"""Novita AI SDK for Python."""
+"""Novita AI SDK for Python.
 
+Model and exception re-exports are resolved lazily (PEP 562), so
+``import novita`` only pays for the client classes; the generated
+pydantic models are built on first reference.
+"""
+
+import importlib
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 from novita.client import AsyncNovitaClient, NovitaClient
-from novita.exceptions import (
-    APIError,
-    AuthenticationError,
-    BadRequestError,
-    NotFoundError,
-    NovitaError,
-    RateLimitError,
-    TimeoutError,
-)
-from novita.generated.models import (
-    BillingMode,
-    CreateInstanceRequest,
-    CreateInstanceResponse,
-    EditInstanceRequest,
-    GPUProduct,
-    InstanceInfo,
-    Kind,
-    ListGPUProductsResponse,
-    ListInstancesResponse,
-    Port,
-    SaveImageRequest,
-    Type,
-    UpgradeInstanceRequest,
-)
+
+if TYPE_CHECKING:
+    from novita.exceptions import (
+        APIError,
+        AuthenticationError,
+        BadRequestError,
+        NotFoundError,
+        NovitaError,
+        RateLimitError,
+        TimeoutError,
+    )
+    from novita.generated.models import (
+        BillingMode,
+        CreateInstanceRequest,
+        CreateInstanceResponse,
+        EditInstanceRequest,
+        GPUProduct,
+        InstanceInfo,
+        Kind,
+        ListGPUProductsResponse,
+        ListInstancesResponse,
+        Port,
+        SaveImageRequest,
+        Status,
+        Type,
+        UpgradeInstanceRequest,
+    )
 
 __version__ = version("novita-sdk")
 
@@ -55,5 +65,42 @@ __all__ = [
     "Kind",
     "BillingMode",
     "Port",
+    "Status",
     "Type",
 ]
+
+# Maps each lazily re-exported name to its defining module
+_LAZY = {
+    "NovitaError": "novita.exceptions",
+    "APIError": "novita.exceptions",
+    "AuthenticationError": "novita.exceptions",
+    "BadRequestError": "novita.exceptions",
+    "NotFoundError": "novita.exceptions",
+    "RateLimitError": "novita.exceptions",
+    "TimeoutError": "novita.exceptions",
+    "CreateInstanceRequest": "novita.generated.models",
+    "CreateInstanceResponse": "novita.generated.models",
+    "EditInstanceRequest": "novita.generated.models",
+    "UpgradeInstanceRequest": "novita.generated.models",
+    "SaveImageRequest": "novita.generated.models",
+    "InstanceInfo": "novita.generated.models",
+    "ListInstancesResponse": "novita.generated.models",
+    "GPUProduct": "novita.generated.models",
+    "ListGPUProductsResponse": "novita.generated.models",
+    "Kind": "novita.generated.models",
+    "BillingMode": "novita.generated.models",
+    "Port": "novita.generated.models",
+    "Status": "novita.generated.models",
+    "Type": "novita.generated.models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a lazily re-exported name on first access and cache it."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    attr = getattr(importlib.import_module(module_name), name)
+    globals()[name] = attr
+    return attr
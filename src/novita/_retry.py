@@ -0,0 +1,96 @@
+"""Bounded retry with exponential backoff and jitter for transient failures."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import random
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import httpx
+
+from novita.exceptions import APIError, RateLimitError, TimeoutError
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_RETRIES = 3
+DEFAULT_BASE_DELAY = 0.2
+DEFAULT_CAP_DELAY = 4.0
+
+
+def _is_transient(error: Exception) -> bool:
+    """Check whether an error is worth retrying.
+
+    Args:
+        error: The exception raised by an API call
+
+    Returns:
+        True for timeouts, rate limits and 5xx server errors
+    """
+    # httpx timeouts propagate raw from the transport layer; the client's
+    # response hook (which maps errors to SDK exceptions) never runs for
+    # requests that time out
+    if isinstance(error, TimeoutError | RateLimitError | httpx.TimeoutException):
+        return True
+    return (
+        isinstance(error, APIError) and error.status_code is not None and error.status_code >= 500
+    )
+
+
+def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with jitter: min(cap, base * 2**attempt) * U(0.5, 1.5)."""
+    delay: float = min(cap, base * 2**attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
+def retry(
+    retries: int = DEFAULT_RETRIES,
+    base: float = DEFAULT_BASE_DELAY,
+    cap: float = DEFAULT_CAP_DELAY,
+) -> Callable[[F], F]:
+    """Retry transient API failures with exponential backoff and jitter.
+
+    Works on both sync and async callables. Only timeouts, rate limits
+    and 5xx responses are retried; client errors surface immediately.
+
+    Args:
+        retries: Maximum number of retries after the initial attempt
+        base: Initial backoff delay in seconds
+        cap: Upper bound on the backoff delay in seconds
+
+    Returns:
+        A decorator wrapping the callable with retry behavior
+    """
+
+    def decorator(func: F) -> F:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                for attempt in range(retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as error:
+                        if attempt >= retries or not _is_transient(error):
+                            raise
+                        await asyncio.sleep(_backoff_delay(attempt, base, cap))
+                return None  # pragma: no cover - loop always returns or raises
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(retries + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as error:
+                    if attempt >= retries or not _is_transient(error):
+                        raise
+                    time.sleep(_backoff_delay(attempt, base, cap))
+            return None  # pragma: no cover - loop always returns or raises
+
+        return sync_wrapper  # type: ignore[return-value]
+
+    return decorator
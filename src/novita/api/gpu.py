@@ -1,77 +1,128 @@
 """GPU API client with resource-based structure."""
 
-from typing import TYPE_CHECKING
-
-from .resources.gpu import (
-    AsyncClusters,
-    AsyncEndpoints,
-    AsyncImagePrewarm,
-    AsyncInstances,
-    AsyncJobs,
-    AsyncMetrics,
-    AsyncNetworks,
-    AsyncProducts,
-    AsyncRegistries,
-    AsyncStorages,
-    AsyncTemplates,
-    Clusters,
-    Endpoints,
-    ImagePrewarm,
-    Instances,
-    Jobs,
-    Metrics,
-    Networks,
-    Products,
-    Registries,
-    Storages,
-    Templates,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import httpx
 
+    from .resources.gpu import (
+        AsyncClusters,
+        AsyncEndpoints,
+        AsyncImagePrewarm,
+        AsyncInstances,
+        AsyncJobs,
+        AsyncMetrics,
+        AsyncNetworks,
+        AsyncProducts,
+        AsyncRegistries,
+        AsyncStorages,
+        AsyncTemplates,
+        Clusters,
+        Endpoints,
+        ImagePrewarm,
+        Instances,
+        Jobs,
+        Metrics,
+        Networks,
+        Products,
+        Registries,
+        Storages,
+        Templates,
+    )
+
+# Maps attribute name -> (resource module, sync class name). Resources are
+# constructed on first attribute access instead of eagerly in __init__, so
+# a caller that only touches client.gpu.endpoints never imports or builds
+# the other ten resource classes (and their generated pydantic models).
+_RESOURCES = {
+    "clusters": ("clusters", "Clusters"),
+    "endpoints": ("endpoints", "Endpoints"),
+    "image_prewarm": ("image_prewarm", "ImagePrewarm"),
+    "instances": ("instances", "Instances"),
+    "jobs": ("jobs", "Jobs"),
+    "metrics": ("metrics", "Metrics"),
+    "networks": ("networks", "Networks"),
+    "products": ("products", "Products"),
+    "registries": ("registries", "Registries"),
+    "storages": ("storages", "Storages"),
+    "templates": ("templates", "Templates"),
+}
+
+
+def _load_resource(name: str, async_variant: bool) -> Any:
+    """Import the resource module for ``name`` and return the class.
+
+    Raises:
+        AttributeError: If ``name`` is not a known resource attribute
+    """
+    try:
+        module_name, class_name = _RESOURCES[name]
+    except KeyError:
+        raise AttributeError(name) from None
+    module = importlib.import_module(f".resources.gpu.{module_name}", __package__)
+    return getattr(module, f"Async{class_name}" if async_variant else class_name)
+
 
 class GpuClient:
     """Synchronous GPU API client with resource-based structure."""
 
+    if TYPE_CHECKING:
+        clusters: Clusters
+        endpoints: Endpoints
+        image_prewarm: ImagePrewarm
+        instances: Instances
+        jobs: Jobs
+        metrics: Metrics
+        networks: Networks
+        products: Products
+        registries: Registries
+        storages: Storages
+        templates: Templates
+
     def __init__(self, client: "httpx.Client") -> None:
-        """Initialize the GPU client with all resources.
+        """Initialize the GPU client.
 
         Args:
             client: The httpx client instance
         """
-        # Initialize all GPU API resources
-        self.clusters = Clusters(client)
-        self.endpoints = Endpoints(client)
-        self.image_prewarm = ImagePrewarm(client)
-        self.instances = Instances(client)
-        self.jobs = Jobs(client)
-        self.metrics = Metrics(client)
-        self.networks = Networks(client)
-        self.products = Products(client)
-        self.registries = Registries(client)
-        self.storages = Storages(client)
-        self.templates = Templates(client)
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        """Build a GPU API resource lazily on first access."""
+        resource = _load_resource(name, async_variant=False)(self._client)
+        # Cache on the instance so __getattr__ never fires for it again
+        setattr(self, name, resource)
+        return resource
 
 
 class AsyncGpuClient:
     """Asynchronous GPU API client with resource-based structure."""
 
+    if TYPE_CHECKING:
+        clusters: AsyncClusters
+        endpoints: AsyncEndpoints
+        image_prewarm: AsyncImagePrewarm
+        instances: AsyncInstances
+        jobs: AsyncJobs
+        metrics: AsyncMetrics
+        networks: AsyncNetworks
+        products: AsyncProducts
+        registries: AsyncRegistries
+        storages: AsyncStorages
+        templates: AsyncTemplates
+
     def __init__(self, client: "httpx.AsyncClient") -> None:
-        """Initialize the async GPU client with all resources.
+        """Initialize the async GPU client.
 
         Args:
             client: The httpx async client instance
         """
-        # Initialize all async GPU API resources
-        self.clusters = AsyncClusters(client)
-        self.endpoints = AsyncEndpoints(client)
-        self.image_prewarm = AsyncImagePrewarm(client)
-        self.instances = AsyncInstances(client)
-        self.jobs = AsyncJobs(client)
-        self.metrics = AsyncMetrics(client)
-        self.networks = AsyncNetworks(client)
-        self.products = AsyncProducts(client)
-        self.registries = AsyncRegistries(client)
-        self.storages = AsyncStorages(client)
-        self.templates = AsyncTemplates(client)
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        """Build a GPU API resource lazily on first access."""
+        resource = _load_resource(name, async_variant=True)(self._client)
+        # Cache on the instance so __getattr__ never fires for it again
+        setattr(self, name, resource)
+        return resource
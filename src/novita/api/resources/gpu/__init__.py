@@ -1,17 +1,26 @@
-"""GPU API resources."""
+"""GPU API resources.
 
-from .base import AsyncBaseResource, BaseResource
-from .clusters import AsyncClusters, Clusters
-from .endpoints import AsyncEndpoints, Endpoints
-from .image_prewarm import AsyncImagePrewarm, ImagePrewarm
-from .instances import AsyncInstances, Instances
-from .jobs import AsyncJobs, Jobs
-from .metrics import AsyncMetrics, Metrics
-from .networks import AsyncNetworks, Networks
-from .products import AsyncProducts, Products
-from .registries import AsyncRegistries, Registries
-from .storages import AsyncStorages, Storages
-from .templates import AsyncTemplates, Templates
+Re-exports are resolved lazily (PEP 562) so importing this package does not
+pull in every resource module — and the generated pydantic models behind
+them — until a class is actually referenced.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import AsyncBaseResource, BaseResource
+    from .clusters import AsyncClusters, Clusters
+    from .endpoints import AsyncEndpoints, Endpoints
+    from .image_prewarm import AsyncImagePrewarm, ImagePrewarm
+    from .instances import AsyncInstances, Instances
+    from .jobs import AsyncJobs, Jobs
+    from .metrics import AsyncMetrics, Metrics
+    from .networks import AsyncNetworks, Networks
+    from .products import AsyncProducts, Products
+    from .registries import AsyncRegistries, Registries
+    from .storages import AsyncStorages, Storages
+    from .templates import AsyncTemplates, Templates
 
 __all__ = [
     "BaseResource",
@@ -39,3 +48,43 @@ __all__ = [
     "Templates",
     "AsyncTemplates",
 ]
+
+# Maps each exported class name to the submodule that defines it
+_SUBMODULES_BY_NAME = {
+    "BaseResource": "base",
+    "AsyncBaseResource": "base",
+    "Clusters": "clusters",
+    "AsyncClusters": "clusters",
+    "Endpoints": "endpoints",
+    "AsyncEndpoints": "endpoints",
+    "ImagePrewarm": "image_prewarm",
+    "AsyncImagePrewarm": "image_prewarm",
+    "Instances": "instances",
+    "AsyncInstances": "instances",
+    "Jobs": "jobs",
+    "AsyncJobs": "jobs",
+    "Metrics": "metrics",
+    "AsyncMetrics": "metrics",
+    "Networks": "networks",
+    "AsyncNetworks": "networks",
+    "Products": "products",
+    "AsyncProducts": "products",
+    "Registries": "registries",
+    "AsyncRegistries": "registries",
+    "Storages": "storages",
+    "AsyncStorages": "storages",
+    "Templates": "templates",
+    "AsyncTemplates": "templates",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule for ``name`` on first access and cache the class."""
+    try:
+        submodule_name = _SUBMODULES_BY_NAME[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(f".{submodule_name}", __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr
+    return attr
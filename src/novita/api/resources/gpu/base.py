@@ -1,33 +1,191 @@
 """Base classes for GPU API resources."""
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from novita.exceptions import APIError
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
     import httpx
+    from pydantic import BaseModel
+
+_T = TypeVar("_T")
 
 # Base path for all GPU instance API endpoints
 BASE_PATH = "/gpu-instance/openapi/v1"
 
+# Header set for bodies we serialize ourselves (httpx only adds it for json=)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def _json_dict(coro: "Awaitable[httpx.Response]") -> dict[str, Any]:
+    """Await a request and return its decoded JSON body as a dict.
+
+    Pass-through methods that only need ``.json()`` chain through this one
+    shared coroutine instead of each defining an async wrapper of their own.
+    """
+    response = await coro
+    return cast(dict[str, Any], response.json())
+
 
 class BaseResource:
     """Base class for synchronous GPU API resources."""
 
-    def __init__(self, client: "httpx.Client") -> None:
+    def __init__(self, client: "httpx.Client", *, cache_ttl: float | None = None) -> None:
         """Initialize the resource.
 
         Args:
             client: The httpx client instance
+            cache_ttl: Override for the TTL (in seconds) of this resource's
+                cached GETs; 0 disables caching, None keeps per-call defaults
         """
         self._client = client
+        self._cache_ttl = cache_ttl
+        self._response_cache: dict[str, tuple[float, Any, str | None]] = {}
+
+    def _cached_get(self, path: str, parser: "Callable[[httpx.Response], _T]", ttl: float) -> _T:
+        """GET an idempotent path with a TTL + ETag cache of the parsed object.
+
+        Within the TTL window the parsed object is returned without any
+        network or parse work. After expiry the request carries
+        If-None-Match when an ETag is known, so an unchanged resource costs
+        a bodyless 304 and reuses the cached object.
+        """
+        if self._cache_ttl is not None:
+            ttl = self._cache_ttl
+        if ttl <= 0:
+            return parser(self._client.get(path))
+
+        now = time.monotonic()
+        cached = self._response_cache.get(path)
+        if cached is not None:
+            expiry, parsed, etag = cached
+            if now < expiry:
+                # Cache entries are stored as Any; the parser for a given
+                # path always produces the same type
+                return cast("_T", parsed)
+            if etag:
+                try:
+                    response = self._client.get(path, headers={"If-None-Match": etag})
+                except APIError as exc:
+                    # The client's response hook raises on any non-2xx,
+                    # including the 304 we asked for
+                    if exc.status_code != 304:
+                        raise
+                    self._response_cache[path] = (now + ttl, parsed, etag)
+                    return cast("_T", parsed)
+            else:
+                response = self._client.get(path)
+        else:
+            response = self._client.get(path)
+
+        parsed = parser(response)
+        self._response_cache[path] = (now + ttl, parsed, response.headers.get("etag"))
+        return parsed
+
+    def _post_model(self, path: str, request: "BaseModel") -> "httpx.Response":
+        """POST a pydantic model as the request body.
+
+        Serializes with ``model_dump_json`` in one pass (pydantic-core's
+        Rust serializer straight to bytes) instead of ``model_dump`` to a
+        dict that httpx would re-encode with stdlib json.
+        """
+        return self._client.post(
+            path,
+            content=request.model_dump_json(by_alias=True, exclude_none=True),
+            headers=_JSON_HEADERS,
+        )
 
 
 class AsyncBaseResource:
     """Base class for asynchronous GPU API resources."""
 
-    def __init__(self, client: "httpx.AsyncClient") -> None:
+    def __init__(self, client: "httpx.AsyncClient", *, cache_ttl: float | None = None) -> None:
         """Initialize the async resource.
 
         Args:
             client: The httpx async client instance
+            cache_ttl: Override for the TTL (in seconds) of this resource's
+                cached GETs; 0 disables caching, None keeps per-call defaults
         """
         self._client = client
+        self._cache_ttl = cache_ttl
+        self._response_cache: dict[str, tuple[float, Any, str | None]] = {}
+
+    async def _cached_get(
+        self, path: str, parser: "Callable[[httpx.Response], _T]", ttl: float
+    ) -> _T:
+        """GET an idempotent path with a TTL + ETag cache of the parsed object.
+
+        Async mirror of BaseResource._cached_get.
+        """
+        if self._cache_ttl is not None:
+            ttl = self._cache_ttl
+        if ttl <= 0:
+            return parser(await self._client.get(path))
+
+        now = time.monotonic()
+        cached = self._response_cache.get(path)
+        if cached is not None:
+            expiry, parsed, etag = cached
+            if now < expiry:
+                # Cache entries are stored as Any; the parser for a given
+                # path always produces the same type
+                return cast("_T", parsed)
+            if etag:
+                try:
+                    response = await self._client.get(path, headers={"If-None-Match": etag})
+                except APIError as exc:
+                    # The client's response hook raises on any non-2xx,
+                    # including the 304 we asked for
+                    if exc.status_code != 304:
+                        raise
+                    self._response_cache[path] = (now + ttl, parsed, etag)
+                    return cast("_T", parsed)
+            else:
+                response = await self._client.get(path)
+        else:
+            response = await self._client.get(path)
+
+        parsed = parser(response)
+        self._response_cache[path] = (now + ttl, parsed, response.headers.get("etag"))
+        return parsed
+
+    async def _gather(self, coros: "Iterable[Awaitable[_T]]", *, limit: int = 16) -> list[_T]:
+        """Run awaitables concurrently with a concurrency cap.
+
+        Independent API calls overlap their round-trips instead of being
+        awaited one by one, while the semaphore keeps at most ``limit``
+        requests in flight so batch helpers don't trip API rate limits.
+        Results are returned in the order of ``coros`` regardless of
+        completion order.
+
+        Args:
+            coros: The awaitables to run
+            limit: Maximum number of requests in flight at once
+
+        Returns:
+            The results, in input order
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(coro: "Awaitable[_T]") -> _T:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros))
+
+    def _post_model(self, path: str, request: "BaseModel") -> "Awaitable[httpx.Response]":
+        """POST a pydantic model as the request body.
+
+        Async mirror of BaseResource._post_model; the request coroutine is
+        returned directly for the caller to await.
+        """
+        return self._client.post(
+            path,
+            content=request.model_dump_json(by_alias=True, exclude_none=True),
+            headers=_JSON_HEADERS,
+        )
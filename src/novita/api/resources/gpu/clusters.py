@@ -3,10 +3,23 @@
 from collections.abc import Iterable
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from novita.generated.models import Cluster
 
 from .base import BASE_PATH, AsyncBaseResource, BaseResource
 
+# Built once at import: validates the whole payload list in a single
+# pydantic-core call instead of one model_validate per item.
+_CLUSTER_LIST_ADAPTER: TypeAdapter[list[Cluster]] = TypeAdapter(list[Cluster])
+
+# Cluster availability changes on the order of minutes, so the parsed list
+# is cached briefly; construct the resource with cache_ttl=0 to disable.
+_CLUSTERS_CACHE_TTL = 300.0
+
+# Request path built once at import instead of per call.
+_URL_CLUSTERS = f"{BASE_PATH}/clusters"
+
 
 def _parse_clusters(payload: Any) -> list[Cluster]:
     """Normalize API payloads into a list of Cluster models."""
@@ -23,7 +36,7 @@ def _parse_clusters(payload: Any) -> list[Cluster]:
         items = payload
     else:
         items = [payload]
-    return [Cluster.model_validate(item) for item in items]
+    return _CLUSTER_LIST_ADAPTER.validate_python(list(items))
 
 
 class Clusters(BaseResource):
@@ -35,12 +48,18 @@ class Clusters(BaseResource):
         Returns:
             List of available clusters
 
+        Results are cached for a few minutes (with ETag revalidation on
+        expiry); pass cache_ttl=0 to the resource to always fetch fresh.
+
         Raises:
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = self._client.get(f"{BASE_PATH}/clusters")
-        return _parse_clusters(response.json())
+        return self._cached_get(
+            _URL_CLUSTERS,
+            lambda response: _parse_clusters(response.json()),
+            _CLUSTERS_CACHE_TTL,
+        )
 
 
 class AsyncClusters(AsyncBaseResource):
@@ -52,9 +71,15 @@ class AsyncClusters(AsyncBaseResource):
         Returns:
             List of available clusters
 
+        Results are cached for a few minutes (with ETag revalidation on
+        expiry); pass cache_ttl=0 to the resource to always fetch fresh.
+
         Raises:
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = await self._client.get(f"{BASE_PATH}/clusters")
-        return _parse_clusters(response.json())
+        return await self._cached_get(
+            _URL_CLUSTERS,
+            lambda response: _parse_clusters(response.json()),
+            _CLUSTERS_CACHE_TTL,
+        )
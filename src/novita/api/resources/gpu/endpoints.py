@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+import builtins
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Iterator
 
 from novita.generated.models import (
     CreateEndpointRequest,
@@ -13,6 +17,19 @@ from novita.generated.models import (
 
 from .base import BASE_PATH, AsyncBaseResource, BaseResource
 
+# Limit ranges are account-level settings that change rarely; cache the
+# parsed dict briefly (construct the resource with cache_ttl=0 to disable).
+_LIMIT_RANGES_CACHE_TTL = 300.0
+
+# Request paths built once at import instead of re-formatting BASE_PATH
+# into a fresh string on every call.
+_URL_LIMIT = f"{BASE_PATH}/endpoint/limit"
+_URL_CREATE = f"{BASE_PATH}/endpoint/create"
+_URL_LIST = f"{BASE_PATH}/endpoints"
+_URL_GET = f"{BASE_PATH}/endpoint"
+_URL_UPDATE = f"{BASE_PATH}/endpoint/update"
+_URL_DELETE = f"{BASE_PATH}/endpoint/delete"
+
 
 class Endpoints(BaseResource):
     """Synchronous GPU endpoints management resource."""
@@ -21,14 +38,17 @@ class Endpoints(BaseResource):
         """Get endpoint limit ranges.
 
         Returns:
-            Endpoint limit range information
+            Endpoint limit range information (cached for a few minutes)
 
         Raises:
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = self._client.get(f"{BASE_PATH}/endpoint/limit")
-        return cast(dict[str, Any], response.json())
+        return self._cached_get(
+            _URL_LIMIT,
+            lambda response: cast(dict[str, Any], response.json()),
+            _LIMIT_RANGES_CACHE_TTL,
+        )
 
     def create(self, request: CreateEndpointRequest) -> EndpointDetail:
         """Create a new endpoint.
@@ -44,11 +64,8 @@ class Endpoints(BaseResource):
             BadRequestError: If request parameters are invalid
             APIError: If the API returns an error
         """
-        response = self._client.post(
-            f"{BASE_PATH}/endpoint/create",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
-        return EndpointDetail.model_validate(response.json())
+        response = self._post_model(_URL_CREATE, request)
+        return EndpointDetail.model_validate_json(response.content)
 
     def list(self) -> list[EndpointDetail]:
         """List all endpoints.
@@ -60,10 +77,22 @@ class Endpoints(BaseResource):
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = self._client.get(f"{BASE_PATH}/endpoints")
-        parsed = ListEndpointsResponse.model_validate(response.json())
+        response = self._client.get(_URL_LIST)
+        parsed = ListEndpointsResponse.model_validate_json(response.content)
         return parsed.endpoints
 
+    def iter_list(self) -> Iterator[EndpointDetail]:
+        """Lazily iterate endpoints, validating items on demand.
+
+        One request is made up front, but each item is validated only as
+        it is consumed — callers that ``break`` early skip the pydantic
+        validation cost of the remaining entries.
+        """
+
+        response = self._client.get(_URL_LIST)
+        for item in response.json().get("endpoints", []):
+            yield EndpointDetail.model_validate(item)
+
     def get(self, endpoint_id: str) -> EndpointDetail:
         """Get details of a specific endpoint.
 
@@ -78,8 +107,8 @@ class Endpoints(BaseResource):
             NotFoundError: If endpoint doesn't exist
             APIError: If the API returns an error
         """
-        response = self._client.get(f"{BASE_PATH}/endpoint", params={"endpoint_id": endpoint_id})
-        return EndpointDetail.model_validate(response.json())
+        response = self._client.get(_URL_GET, params={"endpoint_id": endpoint_id})
+        return EndpointDetail.model_validate_json(response.content)
 
     def update(self, endpoint_id: str, request: UpdateEndpointRequest) -> EndpointDetail:
         """Update an endpoint.
@@ -101,8 +130,8 @@ class Endpoints(BaseResource):
             "endpoint_id": endpoint_id,
             **request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         }
-        response = self._client.post(f"{BASE_PATH}/endpoint/update", json=data)
-        return EndpointDetail.model_validate(response.json())
+        response = self._client.post(_URL_UPDATE, json=data)
+        return EndpointDetail.model_validate_json(response.content)
 
     def delete(self, endpoint_id: str) -> None:
         """Delete an endpoint.
@@ -115,24 +144,30 @@ class Endpoints(BaseResource):
             NotFoundError: If endpoint doesn't exist
             APIError: If the API returns an error
         """
-        self._client.post(f"{BASE_PATH}/endpoint/delete", json={"endpoint_id": endpoint_id})
+        self._client.post(_URL_DELETE, json={"endpoint_id": endpoint_id})
 
 
 class AsyncEndpoints(AsyncBaseResource):
     """Asynchronous GPU endpoints management resource."""
 
-    async def get_limit_ranges(self) -> dict[str, Any]:
+    def get_limit_ranges(self) -> Awaitable[dict[str, Any]]:
         """Get endpoint limit ranges.
 
+        The cache-aware coroutine is returned directly (no wrapper frame);
+        await the result as usual.
+
         Returns:
-            Endpoint limit range information
+            Endpoint limit range information (cached for a few minutes)
 
         Raises:
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = await self._client.get(f"{BASE_PATH}/endpoint/limit")
-        return cast(dict[str, Any], response.json())
+        return self._cached_get(
+            _URL_LIMIT,
+            lambda response: cast(dict[str, Any], response.json()),
+            _LIMIT_RANGES_CACHE_TTL,
+        )
 
     async def create(self, request: CreateEndpointRequest) -> EndpointDetail:
         """Create a new endpoint.
@@ -148,11 +183,8 @@ class AsyncEndpoints(AsyncBaseResource):
             BadRequestError: If request parameters are invalid
             APIError: If the API returns an error
         """
-        response = await self._client.post(
-            f"{BASE_PATH}/endpoint/create",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
-        return EndpointDetail.model_validate(response.json())
+        response = await self._post_model(_URL_CREATE, request)
+        return EndpointDetail.model_validate_json(response.content)
 
     async def list(self) -> list[EndpointDetail]:
         """List all endpoints.
@@ -164,10 +196,20 @@ class AsyncEndpoints(AsyncBaseResource):
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = await self._client.get(f"{BASE_PATH}/endpoints")
-        parsed = ListEndpointsResponse.model_validate(response.json())
+        response = await self._client.get(_URL_LIST)
+        parsed = ListEndpointsResponse.model_validate_json(response.content)
         return parsed.endpoints
 
+    async def iter_list(self) -> AsyncIterator[EndpointDetail]:
+        """Lazily iterate endpoints, validating items on demand.
+
+        Async mirror of Endpoints.iter_list.
+        """
+
+        response = await self._client.get(_URL_LIST)
+        for item in response.json().get("endpoints", []):
+            yield EndpointDetail.model_validate(item)
+
     async def get(self, endpoint_id: str) -> EndpointDetail:
         """Get details of a specific endpoint.
 
@@ -182,10 +224,8 @@ class AsyncEndpoints(AsyncBaseResource):
             NotFoundError: If endpoint doesn't exist
             APIError: If the API returns an error
         """
-        response = await self._client.get(
-            f"{BASE_PATH}/endpoint", params={"endpoint_id": endpoint_id}
-        )
-        return EndpointDetail.model_validate(response.json())
+        response = await self._client.get(_URL_GET, params={"endpoint_id": endpoint_id})
+        return EndpointDetail.model_validate_json(response.content)
 
     async def update(self, endpoint_id: str, request: UpdateEndpointRequest) -> EndpointDetail:
         """Update an endpoint.
@@ -207,8 +247,8 @@ class AsyncEndpoints(AsyncBaseResource):
             "endpoint_id": endpoint_id,
             **request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         }
-        response = await self._client.post(f"{BASE_PATH}/endpoint/update", json=data)
-        return EndpointDetail.model_validate(response.json())
+        response = await self._client.post(_URL_UPDATE, json=data)
+        return EndpointDetail.model_validate_json(response.content)
 
     async def delete(self, endpoint_id: str) -> None:
         """Delete an endpoint.
@@ -221,4 +261,33 @@ class AsyncEndpoints(AsyncBaseResource):
             NotFoundError: If endpoint doesn't exist
             APIError: If the API returns an error
         """
-        await self._client.post(f"{BASE_PATH}/endpoint/delete", json={"endpoint_id": endpoint_id})
+        await self._client.post(_URL_DELETE, json={"endpoint_id": endpoint_id})
+
+    async def get_many(self, endpoint_ids: builtins.list[str]) -> builtins.list[EndpointDetail]:
+        """Fetch several endpoints concurrently.
+
+        Args:
+            endpoint_ids: The IDs of the endpoints
+
+        Returns:
+            Endpoint details in the same order as ``endpoint_ids``
+
+        Raises:
+            AuthenticationError: If API key is invalid
+            NotFoundError: If any endpoint doesn't exist
+            APIError: If the API returns an error
+        """
+        return await self._gather([self.get(endpoint_id) for endpoint_id in endpoint_ids])
+
+    async def delete_many(self, endpoint_ids: builtins.list[str]) -> None:
+        """Delete several endpoints concurrently.
+
+        Args:
+            endpoint_ids: The IDs of the endpoints
+
+        Raises:
+            AuthenticationError: If API key is invalid
+            NotFoundError: If any endpoint doesn't exist
+            APIError: If the API returns an error
+        """
+        await self._gather([self.delete(endpoint_id) for endpoint_id in endpoint_ids])
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+import builtins
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Iterator
 
 from novita.generated.models import (
     CreateImagePrewarmRequest,
@@ -14,6 +18,17 @@ from novita.generated.models import (
 
 from .base import BASE_PATH, AsyncBaseResource, BaseResource
 
+# Prewarm quota moves slowly; cache the parsed dict for a short window
+# (construct the resource with cache_ttl=0 to disable).
+_QUOTA_CACHE_TTL = 60.0
+
+# Request paths built once at import instead of re-formatting BASE_PATH
+# into a fresh string on every call.
+_URL_PREWARM = f"{BASE_PATH}/image/prewarm"
+_URL_EDIT = f"{BASE_PATH}/image/prewarm/edit"
+_URL_DELETE = f"{BASE_PATH}/image/prewarm/delete"
+_URL_QUOTA = f"{BASE_PATH}/image/prewarm/quota"
+
 
 class ImagePrewarm(BaseResource):
     """Synchronous GPU image prewarm management resource."""
@@ -28,10 +43,22 @@ class ImagePrewarm(BaseResource):
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = self._client.get(f"{BASE_PATH}/image/prewarm")
-        parsed = ListImagePrewarmTasksResponse.model_validate(response.json())
+        response = self._client.get(_URL_PREWARM)
+        parsed = ListImagePrewarmTasksResponse.model_validate_json(response.content)
         return parsed.data
 
+    def iter_list(self) -> Iterator[ImagePrewarmTask]:
+        """Lazily iterate image prewarm tasks, validating items on demand.
+
+        One request is made up front, but each item is validated only as
+        it is consumed — callers that ``break`` early skip the pydantic
+        validation cost of the remaining entries.
+        """
+
+        response = self._client.get(_URL_PREWARM)
+        for item in response.json().get("data", []):
+            yield ImagePrewarmTask.model_validate(item)
+
     def create(self, request: CreateImagePrewarmRequest) -> CreateImagePrewarmResponse:
         """Create a new image prewarm task.
 
@@ -46,11 +73,8 @@ class ImagePrewarm(BaseResource):
             BadRequestError: If request parameters are invalid
             APIError: If the API returns an error
         """
-        response = self._client.post(
-            f"{BASE_PATH}/image/prewarm",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
-        return CreateImagePrewarmResponse.model_validate(response.json())
+        response = self._post_model(_URL_PREWARM, request)
+        return CreateImagePrewarmResponse.model_validate_json(response.content)
 
     def update(self, task_id: str, request: UpdateImagePrewarmRequest) -> ImagePrewarmTask:
         """Update an image prewarm task.
@@ -72,8 +96,8 @@ class ImagePrewarm(BaseResource):
             "task_id": task_id,
             **request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         }
-        response = self._client.post(f"{BASE_PATH}/image/prewarm/edit", json=data)
-        return ImagePrewarmTask.model_validate(response.json())
+        response = self._client.post(_URL_EDIT, json=data)
+        return ImagePrewarmTask.model_validate_json(response.content)
 
     def delete(self, task_id: str) -> None:
         """Delete an image prewarm task.
@@ -86,20 +110,23 @@ class ImagePrewarm(BaseResource):
             NotFoundError: If task doesn't exist
             APIError: If the API returns an error
         """
-        self._client.post(f"{BASE_PATH}/image/prewarm/delete", json={"task_id": task_id})
+        self._client.post(_URL_DELETE, json={"task_id": task_id})
 
     def get_quota(self) -> dict[str, Any]:
         """Get image prewarm quota information.
 
         Returns:
-            Quota information for image prewarming
+            Quota information for image prewarming (cached for a short window)
 
         Raises:
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = self._client.get(f"{BASE_PATH}/image/prewarm/quota")
-        return cast(dict[str, Any], response.json())
+        return self._cached_get(
+            _URL_QUOTA,
+            lambda response: cast(dict[str, Any], response.json()),
+            _QUOTA_CACHE_TTL,
+        )
 
 
 class AsyncImagePrewarm(AsyncBaseResource):
@@ -115,10 +142,20 @@ class AsyncImagePrewarm(AsyncBaseResource):
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = await self._client.get(f"{BASE_PATH}/image/prewarm")
-        parsed = ListImagePrewarmTasksResponse.model_validate(response.json())
+        response = await self._client.get(_URL_PREWARM)
+        parsed = ListImagePrewarmTasksResponse.model_validate_json(response.content)
         return parsed.data
 
+    async def iter_list(self) -> AsyncIterator[ImagePrewarmTask]:
+        """Lazily iterate image prewarm tasks, validating items on demand.
+
+        Async mirror of ImagePrewarm.iter_list.
+        """
+
+        response = await self._client.get(_URL_PREWARM)
+        for item in response.json().get("data", []):
+            yield ImagePrewarmTask.model_validate(item)
+
     async def create(self, request: CreateImagePrewarmRequest) -> CreateImagePrewarmResponse:
         """Create a new image prewarm task.
 
@@ -133,11 +170,29 @@ class AsyncImagePrewarm(AsyncBaseResource):
             BadRequestError: If request parameters are invalid
             APIError: If the API returns an error
         """
-        response = await self._client.post(
-            f"{BASE_PATH}/image/prewarm",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
-        return CreateImagePrewarmResponse.model_validate(response.json())
+        response = await self._post_model(_URL_PREWARM, request)
+        return CreateImagePrewarmResponse.model_validate_json(response.content)
+
+    async def create_many(
+        self, requests: builtins.list[CreateImagePrewarmRequest]
+    ) -> builtins.list[CreateImagePrewarmResponse]:
+        """Create several image prewarm tasks concurrently.
+
+        The API accepts one task per request, so submissions are fanned
+        out concurrently instead of awaited one at a time.
+
+        Args:
+            requests: Image prewarm task parameters, one per task
+
+        Returns:
+            Created task information in the same order as ``requests``
+
+        Raises:
+            AuthenticationError: If API key is invalid
+            BadRequestError: If any request parameters are invalid
+            APIError: If the API returns an error
+        """
+        return await self._gather([self.create(request) for request in requests])
 
     async def update(self, task_id: str, request: UpdateImagePrewarmRequest) -> ImagePrewarmTask:
         """Update an image prewarm task.
@@ -159,8 +214,8 @@ class AsyncImagePrewarm(AsyncBaseResource):
             "task_id": task_id,
             **request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         }
-        response = await self._client.post(f"{BASE_PATH}/image/prewarm/edit", json=data)
-        return ImagePrewarmTask.model_validate(response.json())
+        response = await self._client.post(_URL_EDIT, json=data)
+        return ImagePrewarmTask.model_validate_json(response.content)
 
     async def delete(self, task_id: str) -> None:
         """Delete an image prewarm task.
@@ -173,17 +228,36 @@ class AsyncImagePrewarm(AsyncBaseResource):
             NotFoundError: If task doesn't exist
             APIError: If the API returns an error
         """
-        await self._client.post(f"{BASE_PATH}/image/prewarm/delete", json={"task_id": task_id})
+        await self._client.post(_URL_DELETE, json={"task_id": task_id})
 
-    async def get_quota(self) -> dict[str, Any]:
+    async def delete_many(self, task_ids: builtins.list[str]) -> None:
+        """Delete several image prewarm tasks concurrently.
+
+        Args:
+            task_ids: The IDs of the prewarm tasks
+
+        Raises:
+            AuthenticationError: If API key is invalid
+            NotFoundError: If any task doesn't exist
+            APIError: If the API returns an error
+        """
+        await self._gather([self.delete(task_id) for task_id in task_ids])
+
+    def get_quota(self) -> Awaitable[dict[str, Any]]:
         """Get image prewarm quota information.
 
+        The cache-aware coroutine is returned directly (no wrapper frame);
+        await the result as usual.
+
         Returns:
-            Quota information for image prewarming
+            Quota information for image prewarming (cached for a short window)
 
         Raises:
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = await self._client.get(f"{BASE_PATH}/image/prewarm/quota")
-        return cast(dict[str, Any], response.json())
+        return self._cached_get(
+            _URL_QUOTA,
+            lambda response: cast(dict[str, Any], response.json()),
+            _QUOTA_CACHE_TTL,
+        )
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import builtins
+import time
+from collections.abc import AsyncIterator, Iterator
 from typing import Any, cast
+from urllib.parse import urlencode
 
+from novita._retry import retry
 from novita.generated.models import (
     CreateInstanceRequest,
     CreateInstanceResponse,
@@ -16,6 +22,26 @@ from novita.generated.models import (
 
 from .base import BASE_PATH, AsyncBaseResource, BaseResource
 
+# Request paths built once at import time instead of per call
+_URL_CREATE = f"{BASE_PATH}/gpu/instance/create"
+_URL_LIST = f"{BASE_PATH}/gpu/instances"
+_URL_GET = f"{BASE_PATH}/gpu/instance"
+_URL_EDIT = f"{BASE_PATH}/gpu/instance/edit"
+_URL_START = f"{BASE_PATH}/gpu/instance/start"
+_URL_STOP = f"{BASE_PATH}/gpu/instance/stop"
+_URL_DELETE = f"{BASE_PATH}/gpu/instance/delete"
+_URL_RESTART = f"{BASE_PATH}/gpu/instance/restart"
+_URL_UPGRADE = f"{BASE_PATH}/gpu/instance/upgrade"
+_URL_MIGRATE = f"{BASE_PATH}/gpu/instance/migrate"
+_URL_RENEW = f"{BASE_PATH}/gpu/instance/renewInstance"
+_URL_CONVERT = f"{BASE_PATH}/gpu/instance/transToMonthlyInstance"
+_URL_SAVE_IMAGE = f"{BASE_PATH}/job/save/image"
+
+# Instance state moves quickly, so get/list are not cached by default;
+# construct the resource with cache_ttl > 0 to opt in for polling-heavy
+# callers. Mutating calls drop every cached entry.
+_INSTANCE_CACHE_TTL = 0.0
+
 
 def _build_list_filters(
     page_size: int | None,
@@ -41,14 +67,12 @@ def _build_list_filters(
 class Instances(BaseResource):
     """Synchronous GPU instances management resource."""
 
+    @retry()
     def create(self, request: CreateInstanceRequest) -> CreateInstanceResponse:
         """Create a new GPU instance."""
 
-        response = self._client.post(
-            f"{BASE_PATH}/gpu/instance/create",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
-        return CreateInstanceResponse.model_validate(response.json())
+        response = self._post_model(_URL_CREATE, request)
+        return CreateInstanceResponse.model_validate_json(response.content)
 
     def list(
         self,
@@ -62,101 +86,167 @@ class Instances(BaseResource):
         """List GPU instances with optional filters."""
 
         params = _build_list_filters(page_size, page_num, name, product_name, status)
-        response = self._client.get(
-            f"{BASE_PATH}/gpu/instances",
-            params=params or None,
+        path = _URL_LIST
+        if params:
+            path = f"{path}?{urlencode(params)}"
+        parsed = self._cached_get(
+            path,
+            lambda response: ListInstancesResponse.model_validate_json(response.content),
+            _INSTANCE_CACHE_TTL,
         )
-        parsed = ListInstancesResponse.model_validate(response.json())
         return parsed.instances
 
+    def iter(
+        self,
+        *,
+        page_size: int = 100,
+        name: str | None = None,
+        product_name: str | None = None,
+        status: str | None = None,
+    ) -> Iterator[InstanceInfo]:
+        """Lazily iterate instances, fetching pages on demand.
+
+        Callers that stop consuming early (e.g. via itertools.islice)
+        avoid fetching and parsing the remaining pages.
+        """
+
+        page_num = 0
+        while True:
+            page = self.list(
+                page_size=page_size,
+                page_num=page_num,
+                name=name,
+                product_name=product_name,
+                status=status,
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            page_num += 1
+
+    @retry()
     def get(self, instance_id: str) -> InstanceInfo:
         """Fetch details for a specific instance."""
 
-        response = self._client.get(
-            f"{BASE_PATH}/gpu/instance",
-            params={"instanceId": instance_id},
+        return self._cached_get(
+            f"{_URL_GET}?{urlencode({'instanceId': instance_id})}",
+            lambda response: InstanceInfo.model_validate_json(response.content),
+            _INSTANCE_CACHE_TTL,
         )
-        return InstanceInfo.model_validate(response.json())
 
+    def wait_for_status(
+        self,
+        instance_id: str,
+        target: str = "exited",
+        *,
+        timeout: float = 60.0,
+    ) -> InstanceInfo:
+        """Poll an instance until it reaches the target status.
+
+        The API has no long-poll or event-stream variant of get, so this
+        polls with exponential backoff (0.5s doubling up to an 8s cap)
+        instead of a fixed interval.
+
+        Args:
+            instance_id: The instance to watch
+            target: Status value to wait for
+            timeout: Maximum number of seconds to keep polling
+
+        Returns:
+            The most recently fetched instance info; check its status to
+            see whether the target was reached before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.5
+        while True:
+            instance = self.get(instance_id)
+            if instance.status.value == target or time.monotonic() >= deadline:
+                return instance
+            time.sleep(delay)
+            delay = min(delay * 2, 8.0)
+
+    @retry()
     def edit(self, request: EditInstanceRequest) -> None:
         """Edit instance ports or root disk."""
 
-        self._client.post(
-            f"{BASE_PATH}/gpu/instance/edit",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
+        self._post_model(_URL_EDIT, request)
+        self._response_cache.clear()
 
     def start(self, instance_id: str) -> None:
         """Start an instance."""
 
         self._client.post(
-            f"{BASE_PATH}/gpu/instance/start",
+            _URL_START,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
 
+    @retry()
     def stop(self, instance_id: str) -> None:
         """Stop an instance."""
 
         self._client.post(
-            f"{BASE_PATH}/gpu/instance/stop",
+            _URL_STOP,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
 
+    @retry()
     def delete(self, instance_id: str) -> None:
         """Delete an instance."""
 
         self._client.post(
-            f"{BASE_PATH}/gpu/instance/delete",
+            _URL_DELETE,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
 
     def restart(self, instance_id: str) -> None:
         """Restart an instance."""
 
         self._client.post(
-            f"{BASE_PATH}/gpu/instance/restart",
+            _URL_RESTART,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
 
     def upgrade(self, request: UpgradeInstanceRequest) -> None:
         """Upgrade an instance with a new configuration."""
 
-        self._client.post(
-            f"{BASE_PATH}/gpu/instance/upgrade",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
+        self._post_model(_URL_UPGRADE, request)
+        self._response_cache.clear()
 
     def migrate(self, instance_id: str) -> None:
         """Migrate an instance to a different region."""
 
         self._client.post(
-            f"{BASE_PATH}/gpu/instance/migrate",
+            _URL_MIGRATE,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
 
     def renew(self, instance_id: str, month: int) -> None:
         """Renew a subscription instance."""
 
         self._client.post(
-            f"{BASE_PATH}/gpu/instance/renewInstance",
+            _URL_RENEW,
             json={"instanceId": instance_id, "month": month},
         )
+        self._response_cache.clear()
 
     def convert_to_monthly(self, instance_id: str, month: int) -> None:
         """Convert a pay-as-you-go instance to subscription billing."""
 
         self._client.post(
-            f"{BASE_PATH}/gpu/instance/transToMonthlyInstance",
+            _URL_CONVERT,
             json={"instanceId": instance_id, "month": month},
         )
+        self._response_cache.clear()
 
     def save_image(self, request: SaveImageRequest) -> str:
         """Create an image from an instance and return the job ID."""
 
-        response = self._client.post(
-            f"{BASE_PATH}/job/save/image",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
+        response = self._post_model(_URL_SAVE_IMAGE, request)
         payload = cast(dict[str, Any], response.json())
         return str(payload.get("jobId", ""))
 
@@ -164,14 +254,12 @@ class Instances(BaseResource):
 class AsyncInstances(AsyncBaseResource):
     """Asynchronous GPU instances management resource."""
 
+    @retry()
     async def create(self, request: CreateInstanceRequest) -> CreateInstanceResponse:
         """Create a new GPU instance."""
 
-        response = await self._client.post(
-            f"{BASE_PATH}/gpu/instance/create",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
-        return CreateInstanceResponse.model_validate(response.json())
+        response = await self._post_model(_URL_CREATE, request)
+        return CreateInstanceResponse.model_validate_json(response.content)
 
     async def list(
         self,
@@ -185,100 +273,192 @@ class AsyncInstances(AsyncBaseResource):
         """List GPU instances with optional filters."""
 
         params = _build_list_filters(page_size, page_num, name, product_name, status)
-        response = await self._client.get(
-            f"{BASE_PATH}/gpu/instances",
-            params=params or None,
+        path = _URL_LIST
+        if params:
+            path = f"{path}?{urlencode(params)}"
+        parsed = await self._cached_get(
+            path,
+            lambda response: ListInstancesResponse.model_validate_json(response.content),
+            _INSTANCE_CACHE_TTL,
         )
-        parsed = ListInstancesResponse.model_validate(response.json())
         return parsed.instances
 
+    async def iter(
+        self,
+        *,
+        page_size: int = 100,
+        name: str | None = None,
+        product_name: str | None = None,
+        status: str | None = None,
+    ) -> AsyncIterator[InstanceInfo]:
+        """Lazily iterate instances, fetching pages on demand.
+
+        Callers that stop consuming early avoid fetching and parsing the
+        remaining pages.
+        """
+
+        page_num = 0
+        while True:
+            page = await self.list(
+                page_size=page_size,
+                page_num=page_num,
+                name=name,
+                product_name=product_name,
+                status=status,
+            )
+            for instance in page:
+                yield instance
+            if len(page) < page_size:
+                return
+            page_num += 1
+
+    @retry()
     async def get(self, instance_id: str) -> InstanceInfo:
         """Fetch details for a specific instance."""
 
-        response = await self._client.get(
-            f"{BASE_PATH}/gpu/instance",
-            params={"instanceId": instance_id},
+        return await self._cached_get(
+            f"{_URL_GET}?{urlencode({'instanceId': instance_id})}",
+            lambda response: InstanceInfo.model_validate_json(response.content),
+            _INSTANCE_CACHE_TTL,
         )
-        return InstanceInfo.model_validate(response.json())
 
+    async def wait_for_status(
+        self,
+        instance_id: str,
+        target: str = "exited",
+        *,
+        timeout: float = 60.0,
+    ) -> InstanceInfo:
+        """Poll an instance until it reaches the target status.
+
+        The API has no long-poll or event-stream variant of get, so this
+        polls with exponential backoff (0.5s doubling up to an 8s cap)
+        instead of a fixed interval.
+
+        Args:
+            instance_id: The instance to watch
+            target: Status value to wait for
+            timeout: Maximum number of seconds to keep polling
+
+        Returns:
+            The most recently fetched instance info; check its status to
+            see whether the target was reached before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.5
+        while True:
+            instance = await self.get(instance_id)
+            if instance.status.value == target or time.monotonic() >= deadline:
+                return instance
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 8.0)
+
+    @retry()
     async def edit(self, request: EditInstanceRequest) -> None:
         """Edit instance ports or root disk."""
 
-        await self._client.post(
-            f"{BASE_PATH}/gpu/instance/edit",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
+        await self._post_model(_URL_EDIT, request)
+        self._response_cache.clear()
 
     async def start(self, instance_id: str) -> None:
         """Start an instance."""
 
         await self._client.post(
-            f"{BASE_PATH}/gpu/instance/start",
+            _URL_START,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
 
+    @retry()
     async def stop(self, instance_id: str) -> None:
         """Stop an instance."""
 
         await self._client.post(
-            f"{BASE_PATH}/gpu/instance/stop",
+            _URL_STOP,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
 
+    @retry()
     async def delete(self, instance_id: str) -> None:
         """Delete an instance."""
 
         await self._client.post(
-            f"{BASE_PATH}/gpu/instance/delete",
+            _URL_DELETE,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
 
     async def restart(self, instance_id: str) -> None:
         """Restart an instance."""
 
         await self._client.post(
-            f"{BASE_PATH}/gpu/instance/restart",
+            _URL_RESTART,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
+
+    async def get_many(self, instance_ids: builtins.list[str]) -> builtins.list[InstanceInfo]:
+        """Fetch several instances concurrently, in input order."""
+
+        return await self._gather([self.get(instance_id) for instance_id in instance_ids])
+
+    async def start_many(self, instance_ids: builtins.list[str]) -> None:
+        """Start several instances concurrently."""
+
+        await self._gather([self.start(instance_id) for instance_id in instance_ids])
+
+    async def stop_many(self, instance_ids: builtins.list[str]) -> None:
+        """Stop several instances concurrently."""
+
+        await self._gather([self.stop(instance_id) for instance_id in instance_ids])
+
+    async def restart_many(self, instance_ids: builtins.list[str]) -> None:
+        """Restart several instances concurrently."""
+
+        await self._gather([self.restart(instance_id) for instance_id in instance_ids])
+
+    async def delete_many(self, instance_ids: builtins.list[str]) -> None:
+        """Delete several instances concurrently."""
+
+        await self._gather([self.delete(instance_id) for instance_id in instance_ids])
 
     async def upgrade(self, request: UpgradeInstanceRequest) -> None:
         """Upgrade an instance with a new configuration."""
 
-        await self._client.post(
-            f"{BASE_PATH}/gpu/instance/upgrade",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
+        await self._post_model(_URL_UPGRADE, request)
+        self._response_cache.clear()
 
     async def migrate(self, instance_id: str) -> None:
         """Migrate an instance to a different region."""
 
         await self._client.post(
-            f"{BASE_PATH}/gpu/instance/migrate",
+            _URL_MIGRATE,
             json={"instanceId": instance_id},
         )
+        self._response_cache.clear()
 
     async def renew(self, instance_id: str, month: int) -> None:
         """Renew a subscription instance."""
 
         await self._client.post(
-            f"{BASE_PATH}/gpu/instance/renewInstance",
+            _URL_RENEW,
             json={"instanceId": instance_id, "month": month},
         )
+        self._response_cache.clear()
 
     async def convert_to_monthly(self, instance_id: str, month: int) -> None:
         """Convert a pay-as-you-go instance to subscription billing."""
 
         await self._client.post(
-            f"{BASE_PATH}/gpu/instance/transToMonthlyInstance",
+            _URL_CONVERT,
             json={"instanceId": instance_id, "month": month},
         )
+        self._response_cache.clear()
 
     async def save_image(self, request: SaveImageRequest) -> str:
         """Create an image from an instance and return the job ID."""
 
-        response = await self._client.post(
-            f"{BASE_PATH}/job/save/image",
-            json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
-        )
+        response = await self._post_model(_URL_SAVE_IMAGE, request)
         payload = cast(dict[str, Any], response.json())
         return str(payload.get("jobId", ""))
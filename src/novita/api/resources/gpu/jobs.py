@@ -6,6 +6,10 @@ from novita.generated.models import JobModel, ListJobsResponse
 
 from .base import BASE_PATH, AsyncBaseResource, BaseResource
 
+# Request paths built once at import time instead of per call
+_URL_JOBS = f"{BASE_PATH}/jobs"
+_URL_BREAK = f"{BASE_PATH}/job/break"
+
 
 class Jobs(BaseResource):
     """Synchronous GPU jobs management resource."""
@@ -20,8 +24,8 @@ class Jobs(BaseResource):
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = self._client.get(f"{BASE_PATH}/jobs")
-        parsed = ListJobsResponse.model_validate(response.json())
+        response = self._client.get(_URL_JOBS)
+        parsed = ListJobsResponse.model_validate_json(response.content)
         return parsed.jobs
 
     def break_job(self, job_id: str) -> None:
@@ -35,7 +39,7 @@ class Jobs(BaseResource):
             NotFoundError: If job doesn't exist
             APIError: If the API returns an error
         """
-        self._client.post(f"{BASE_PATH}/job/break", json={"job_id": job_id})
+        self._client.post(_URL_BREAK, json={"job_id": job_id})
 
 
 class AsyncJobs(AsyncBaseResource):
@@ -51,8 +55,8 @@ class AsyncJobs(AsyncBaseResource):
             AuthenticationError: If API key is invalid
             APIError: If the API returns an error
         """
-        response = await self._client.get(f"{BASE_PATH}/jobs")
-        parsed = ListJobsResponse.model_validate(response.json())
+        response = await self._client.get(_URL_JOBS)
+        parsed = ListJobsResponse.model_validate_json(response.content)
         return parsed.jobs
 
     async def break_job(self, job_id: str) -> None:
@@ -66,4 +70,4 @@ class AsyncJobs(AsyncBaseResource):
             NotFoundError: If job doesn't exist
             APIError: If the API returns an error
         """
-        await self._client.post(f"{BASE_PATH}/job/break", json={"job_id": job_id})
+        await self._client.post(_URL_BREAK, json={"job_id": job_id})
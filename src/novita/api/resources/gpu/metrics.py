@@ -1,8 +1,13 @@
 """GPU metrics management resource."""
 
-from typing import Any, cast
+from __future__ import annotations
 
-from .base import BASE_PATH, AsyncBaseResource, BaseResource
+from typing import TYPE_CHECKING, Any, cast
+
+from .base import BASE_PATH, AsyncBaseResource, BaseResource, _json_dict
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
 
 
 class Metrics(BaseResource):
@@ -31,9 +36,12 @@ class Metrics(BaseResource):
 class AsyncMetrics(AsyncBaseResource):
     """Asynchronous GPU metrics management resource."""
 
-    async def get(self, instance_id: str) -> dict[str, Any]:
+    def get(self, instance_id: str) -> Awaitable[dict[str, Any]]:
         """Get metrics for a specific instance.
 
+        The request coroutine is returned directly (no wrapper frame);
+        await the result as usual.
+
         Args:
             instance_id: The ID of the instance
 
@@ -45,7 +53,6 @@ class AsyncMetrics(AsyncBaseResource):
             NotFoundError: If instance doesn't exist
             APIError: If the API returns an error
         """
-        response = await self._client.get(
-            f"{BASE_PATH}/instance/metrics", params={"instance_id": instance_id}
+        return _json_dict(
+            self._client.get(f"{BASE_PATH}/instance/metrics", params={"instance_id": instance_id})
         )
-        return cast(dict[str, Any], response.json())
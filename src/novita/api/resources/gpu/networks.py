@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from novita.exceptions import NotFoundError
 from novita.generated.models import (
     CreateNetworkRequest,
-    ListNetworksResponse,
     Network,
     NetworkModel,
     UpdateNetworkRequest,
@@ -15,6 +16,10 @@ from novita.generated.models import (
 
 from .base import BASE_PATH, AsyncBaseResource, BaseResource
 
+# Validates the "networks" array directly; the adapter compiles its
+# pydantic-core schema once, skipping the wrapper response model per call.
+_NETWORK_LIST_ADAPTER: TypeAdapter[list[NetworkModel]] = TypeAdapter(list[NetworkModel])
+
 
 def _parse_single_network(payload: Any) -> Network:
     """Parse a single network from API response.
@@ -51,8 +56,7 @@ class Networks(BaseResource):
             APIError: If the API returns an error
         """
         response = self._client.get(f"{BASE_PATH}/networks")
-        parsed = ListNetworksResponse.model_validate(response.json())
-        return parsed.networks
+        return _NETWORK_LIST_ADAPTER.validate_python(response.json().get("networks", []))
 
     def get(self, network_id: str) -> Network:
         """Get details of a specific network.
@@ -140,8 +144,7 @@ class AsyncNetworks(AsyncBaseResource):
             APIError: If the API returns an error
         """
         response = await self._client.get(f"{BASE_PATH}/networks")
-        parsed = ListNetworksResponse.model_validate(response.json())
-        return parsed.networks
+        return _NETWORK_LIST_ADAPTER.validate_python(response.json().get("networks", []))
 
     async def get(self, network_id: str) -> Network:
         """Get details of a specific network.
@@ -4,15 +4,21 @@ from __future__ import annotations
 
 import builtins
 
-from novita.generated.models import (
-    CPUProduct,
-    GPUProduct,
-    ListCPUProductsResponse,
-    ListGPUProductsResponse,
-)
+from pydantic import TypeAdapter
+
+from novita.generated.models import CPUProduct, GPUProduct
 
 from .base import BASE_PATH, AsyncBaseResource, BaseResource
 
+# Validate the "data" arrays directly; the adapters compile their
+# pydantic-core schemas once, skipping the wrapper response models per call.
+_GPU_PRODUCT_LIST_ADAPTER: TypeAdapter[builtins.list[GPUProduct]] = TypeAdapter(
+    builtins.list[GPUProduct]
+)
+_CPU_PRODUCT_LIST_ADAPTER: TypeAdapter[builtins.list[CPUProduct]] = TypeAdapter(
+    builtins.list[CPUProduct]
+)
+
 
 class Products(BaseResource):
     """Synchronous GPU products and pricing resource."""
@@ -51,8 +57,7 @@ class Products(BaseResource):
             params["billingMethod"] = billing_method
 
         response = self._client.get(f"{BASE_PATH}/products", params=params or None)
-        parsed = ListGPUProductsResponse.model_validate(response.json())
-        return parsed.data
+        return _GPU_PRODUCT_LIST_ADAPTER.validate_python(response.json().get("data", []))
 
     def list_cpu(
         self,
@@ -80,8 +85,7 @@ class Products(BaseResource):
             params["productName"] = product_name
 
         response = self._client.get(f"{BASE_PATH}/cpu/products", params=params or None)
-        parsed = ListCPUProductsResponse.model_validate(response.json())
-        return parsed.data
+        return _CPU_PRODUCT_LIST_ADAPTER.validate_python(response.json().get("data", []))
 
 
 class AsyncProducts(AsyncBaseResource):
@@ -121,8 +125,7 @@ class AsyncProducts(AsyncBaseResource):
             params["billingMethod"] = billing_method
 
         response = await self._client.get(f"{BASE_PATH}/products", params=params or None)
-        parsed = ListGPUProductsResponse.model_validate(response.json())
-        return parsed.data
+        return _GPU_PRODUCT_LIST_ADAPTER.validate_python(response.json().get("data", []))
 
     async def list_cpu(
         self,
@@ -150,5 +153,4 @@ class AsyncProducts(AsyncBaseResource):
             params["productName"] = product_name
 
         response = await self._client.get(f"{BASE_PATH}/cpu/products", params=params or None)
-        parsed = ListCPUProductsResponse.model_validate(response.json())
-        return parsed.data
+        return _CPU_PRODUCT_LIST_ADAPTER.validate_python(response.json().get("data", []))
@@ -28,7 +28,7 @@ class Registries(BaseResource):
             APIError: If the API returns an error
         """
         response = self._client.get(f"{BASE_PATH}/repository/auths")
-        parsed = ListRepositoryAuthsResponse.model_validate(response.json())
+        parsed = ListRepositoryAuthsResponse.model_validate_json(response.content)
         return parsed.data
 
     def create(
@@ -94,7 +94,7 @@ class AsyncRegistries(AsyncBaseResource):
             APIError: If the API returns an error
         """
         response = await self._client.get(f"{BASE_PATH}/repository/auths")
-        parsed = ListRepositoryAuthsResponse.model_validate(response.json())
+        parsed = ListRepositoryAuthsResponse.model_validate_json(response.content)
         return parsed.data
 
     async def create(
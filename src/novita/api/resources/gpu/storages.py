@@ -26,7 +26,7 @@ class Storages(BaseResource):
             APIError: If the API returns an error
         """
         response = self._client.get(f"{BASE_PATH}/networkstorages/list")
-        parsed = ListNetworkStoragesResponse.model_validate(response.json())
+        parsed = ListNetworkStoragesResponse.model_validate_json(response.content)
         return parsed.data or []
 
     def create(self, request: CreateNetworkStorageRequest) -> NetworkStorageModel:
@@ -47,7 +47,7 @@ class Storages(BaseResource):
             f"{BASE_PATH}/networkstorage/create",
             json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
-        return NetworkStorageModel.model_validate(response.json())
+        return NetworkStorageModel.model_validate_json(response.content)
 
     def update(self, request: UpdateNetworkStorageRequest) -> NetworkStorageModel:
         """Update a network storage.
@@ -68,7 +68,7 @@ class Storages(BaseResource):
             f"{BASE_PATH}/networkstorage/update",
             json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
-        return NetworkStorageModel.model_validate(response.json())
+        return NetworkStorageModel.model_validate_json(response.content)
 
     def delete(self, storage_id: str) -> None:
         """Delete a network storage.
@@ -98,7 +98,7 @@ class AsyncStorages(AsyncBaseResource):
             APIError: If the API returns an error
         """
         response = await self._client.get(f"{BASE_PATH}/networkstorages/list")
-        parsed = ListNetworkStoragesResponse.model_validate(response.json())
+        parsed = ListNetworkStoragesResponse.model_validate_json(response.content)
         return parsed.data or []
 
     async def create(self, request: CreateNetworkStorageRequest) -> NetworkStorageModel:
@@ -119,7 +119,7 @@ class AsyncStorages(AsyncBaseResource):
             f"{BASE_PATH}/networkstorage/create",
             json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
-        return NetworkStorageModel.model_validate(response.json())
+        return NetworkStorageModel.model_validate_json(response.content)
 
     async def update(self, request: UpdateNetworkStorageRequest) -> NetworkStorageModel:
         """Update a network storage.
@@ -140,7 +140,7 @@ class AsyncStorages(AsyncBaseResource):
             f"{BASE_PATH}/networkstorage/update",
             json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
-        return NetworkStorageModel.model_validate(response.json())
+        return NetworkStorageModel.model_validate_json(response.content)
 
     async def delete(self, storage_id: str) -> None:
         """Delete a network storage.
@@ -27,7 +27,7 @@ class Templates(BaseResource):
             APIError: If the API returns an error
         """
         response = self._client.get(f"{BASE_PATH}/templates")
-        parsed = ListTemplatesResponse.model_validate(response.json())
+        parsed = ListTemplatesResponse.model_validate_json(response.content)
         return parsed.template
 
     def get(self, template_id: str) -> Template:
@@ -45,7 +45,7 @@ class Templates(BaseResource):
             APIError: If the API returns an error
         """
         response = self._client.get(f"{BASE_PATH}/template", params={"templateId": template_id})
-        parsed = GetTemplateResponse.model_validate(response.json())
+        parsed = GetTemplateResponse.model_validate_json(response.content)
         return parsed.template
 
     def create(self, request: CreateTemplateRequest) -> CreateTemplateResponse:
@@ -66,7 +66,7 @@ class Templates(BaseResource):
             f"{BASE_PATH}/template/create",
             json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
-        return CreateTemplateResponse.model_validate(response.json())
+        return CreateTemplateResponse.model_validate_json(response.content)
 
     def delete(self, template_id: str) -> None:
         """Delete a template.
@@ -96,7 +96,7 @@ class AsyncTemplates(AsyncBaseResource):
             APIError: If the API returns an error
         """
         response = await self._client.get(f"{BASE_PATH}/templates")
-        parsed = ListTemplatesResponse.model_validate(response.json())
+        parsed = ListTemplatesResponse.model_validate_json(response.content)
         return parsed.template
 
     async def get(self, template_id: str) -> Template:
@@ -116,7 +116,7 @@ class AsyncTemplates(AsyncBaseResource):
         response = await self._client.get(
             f"{BASE_PATH}/template", params={"templateId": template_id}
         )
-        parsed = GetTemplateResponse.model_validate(response.json())
+        parsed = GetTemplateResponse.model_validate_json(response.content)
         return parsed.template
 
     async def create(self, request: CreateTemplateRequest) -> CreateTemplateResponse:
@@ -137,7 +137,7 @@ class AsyncTemplates(AsyncBaseResource):
             f"{BASE_PATH}/template/create",
             json=request.model_dump(by_alias=True, exclude_none=True, mode="json"),
         )
-        return CreateTemplateResponse.model_validate(response.json())
+        return CreateTemplateResponse.model_validate_json(response.content)
 
     async def delete(self, template_id: str) -> None:
         """Delete a template.
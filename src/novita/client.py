@@ -17,6 +17,28 @@ from novita.exceptions import (
 
 DEFAULT_BASE_URL = "https://api.novita.ai"
 DEFAULT_TIMEOUT = 60.0
+DEFAULT_POOL_SIZE = 100
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+
+def default_limits(pool_size: int = DEFAULT_POOL_SIZE) -> httpx.Limits:
+    """Return the connection-pool limits used by the SDK clients.
+
+    Users constructing their own ``httpx.Client`` to pass to ``GpuClient``
+    should apply the same limits so idle connections stay open between
+    calls instead of paying a TCP+TLS handshake per request.
+
+    Args:
+        pool_size: Maximum number of (keep-alive) connections in the pool
+
+    Returns:
+        An httpx.Limits with keep-alive sized to the pool
+    """
+    return httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+    )
 
 
 def _handle_error_response(response: httpx.Response) -> None:
@@ -118,6 +140,8 @@ class NovitaClient:
         *,
         base_url: str | None = None,
         timeout: float = DEFAULT_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        http2: bool = False,
     ) -> None:
         """Initialize the Novita client.
 
@@ -125,6 +149,9 @@ class NovitaClient:
             api_key: API key for authentication. If not provided, will look for NOVITA_API_KEY env var
             base_url: Base URL for the API. Defaults to https://api.novita.ai
             timeout: Request timeout in seconds
+            pool_size: Maximum number of (keep-alive) connections in the pool
+            http2: Enable HTTP/2 so concurrent calls multiplex over one connection
+                (requires the optional h2 dependency: pip install novita-sdk[http2])
 
         Raises:
             AuthenticationError: If no API key is provided or found in environment
@@ -139,11 +166,15 @@ class NovitaClient:
         self._base_url = base_url or DEFAULT_BASE_URL
         self._timeout = timeout
 
-        # Create httpx client with authentication
+        # Create httpx client with authentication. Keep-alive connections
+        # let back-to-back calls reuse one TCP+TLS session instead of
+        # paying the handshake per request.
         self._http_client = httpx.Client(
             base_url=self._base_url,
             headers={"Authorization": f"Bearer {self._api_key}"},
             timeout=timeout,
+            http2=http2,
+            limits=default_limits(pool_size),
             event_hooks={"response": [self._handle_response]},
         )
 
@@ -185,6 +216,8 @@ class AsyncNovitaClient:
         *,
         base_url: str | None = None,
         timeout: float = DEFAULT_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        http2: bool = False,
     ) -> None:
         """Initialize the async Novita client.
 
@@ -192,6 +225,9 @@ class AsyncNovitaClient:
             api_key: API key for authentication. If not provided, will look for NOVITA_API_KEY env var
             base_url: Base URL for the API. Defaults to https://api.novita.ai
             timeout: Request timeout in seconds
+            pool_size: Maximum number of (keep-alive) connections in the pool
+            http2: Enable HTTP/2 so concurrent calls multiplex over one connection
+                (requires the optional h2 dependency: pip install novita-sdk[http2])
 
         Raises:
             AuthenticationError: If no API key is provided or found in environment
@@ -206,11 +242,15 @@ class AsyncNovitaClient:
         self._base_url = base_url or DEFAULT_BASE_URL
         self._timeout = timeout
 
-        # Create httpx async client with authentication
+        # Create httpx async client with authentication. Keep-alive
+        # connections let concurrent and back-to-back calls reuse TCP+TLS
+        # sessions instead of paying the handshake per request.
         self._http_client = httpx.AsyncClient(
             base_url=self._base_url,
             headers={"Authorization": f"Bearer {self._api_key}"},
             timeout=timeout,
+            http2=http2,
+            limits=default_limits(pool_size),
             event_hooks={"response": [self._handle_response]},
         )
 
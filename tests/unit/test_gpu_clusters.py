@@ -73,3 +73,69 @@ async def test_async_list_clusters(httpx_mock: HTTPXMock) -> None:
         assert len(clusters) == 1
         assert isinstance(clusters[0], Cluster)
         assert clusters[0].id == "us-west-1"
+
+
+def test_list_clusters_cached(httpx_mock: HTTPXMock) -> None:
+    """Test that repeated list() calls within the TTL reuse the parsed result."""
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/clusters",
+        json={"data": [_cluster_payload()]},
+    )
+
+    client = NovitaClient(api_key="test-key")
+    first = client.gpu.clusters.list()
+    second = client.gpu.clusters.list()
+
+    assert second is first
+    assert len(httpx_mock.get_requests()) == 1
+    client.close()
+
+
+def test_list_clusters_etag_revalidation(httpx_mock: HTTPXMock) -> None:
+    """Test that an expired cache entry revalidates with If-None-Match."""
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/clusters",
+        json={"data": [_cluster_payload()]},
+        headers={"ETag": '"abc123"'},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/clusters",
+        status_code=304,
+    )
+
+    client = NovitaClient(api_key="test-key")
+    clusters = client.gpu.clusters
+    first = clusters.list()
+
+    # Force the cache entry to expire so the next call revalidates
+    path, (_, parsed, etag) = next(iter(clusters._response_cache.items()))
+    clusters._response_cache[path] = (0.0, parsed, etag)
+    second = clusters.list()
+
+    assert second is first
+    revalidation = httpx_mock.get_requests()[1]
+    assert revalidation.headers["If-None-Match"] == '"abc123"'
+    client.close()
+
+
+def test_list_clusters_cache_disabled(httpx_mock: HTTPXMock) -> None:
+    """Test that cache_ttl=0 fetches fresh on every call."""
+    from novita.api.resources.gpu.clusters import Clusters
+
+    for _ in range(2):
+        httpx_mock.add_response(
+            method="GET",
+            url="https://api.novita.ai/gpu-instance/openapi/v1/clusters",
+            json={"data": [_cluster_payload()]},
+        )
+
+    client = NovitaClient(api_key="test-key")
+    clusters = Clusters(client._http_client, cache_ttl=0)
+    clusters.list()
+    clusters.list()
+
+    assert len(httpx_mock.get_requests()) == 2
+    client.close()
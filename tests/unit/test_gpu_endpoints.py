@@ -217,3 +217,67 @@ async def test_async_list_endpoints(httpx_mock: HTTPXMock) -> None:
         assert len(endpoints) == 1
         assert endpoints[0].id == "ep-1"
         assert isinstance(endpoints[0], EndpointDetail)
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_endpoints(httpx_mock: HTTPXMock) -> None:
+    """Test fetching several endpoints concurrently preserves input order."""
+    from novita import AsyncNovitaClient
+
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/endpoint?endpoint_id=ep-1",
+        json=_endpoint_payload(id="ep-1", name="Endpoint 1", state={"state": "running"}),
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/endpoint?endpoint_id=ep-2",
+        json=_endpoint_payload(id="ep-2", name="Endpoint 2", state={"state": "stopped"}),
+    )
+
+    async with AsyncNovitaClient(api_key="test-key") as client:
+        endpoints = await client.gpu.endpoints.get_many(["ep-1", "ep-2"])
+
+        assert [endpoint.id for endpoint in endpoints] == ["ep-1", "ep-2"]
+        assert all(isinstance(endpoint, EndpointDetail) for endpoint in endpoints)
+
+
+@pytest.mark.asyncio
+async def test_async_delete_many_endpoints(httpx_mock: HTTPXMock) -> None:
+    """Test deleting several endpoints concurrently."""
+    from novita import AsyncNovitaClient
+
+    for _ in range(2):
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.novita.ai/gpu-instance/openapi/v1/endpoint/delete",
+            status_code=200,
+        )
+
+    async with AsyncNovitaClient(api_key="test-key") as client:
+        await client.gpu.endpoints.delete_many(["ep-1", "ep-2"])
+
+    requests_made = httpx_mock.get_requests()
+    assert len(requests_made) == 2
+
+
+def test_iter_list_endpoints(httpx_mock: HTTPXMock) -> None:
+    """Test lazily iterating endpoints with early termination."""
+    mock_endpoints = [
+        _endpoint_payload(id="ep-1", name="Primary endpoint"),
+        _endpoint_payload(id="ep-2", name="Backup endpoint"),
+    ]
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/endpoints",
+        json={"endpoints": mock_endpoints, "total": len(mock_endpoints)},
+    )
+
+    client = NovitaClient(api_key="test-key")
+    iterator = client.gpu.endpoints.iter_list()
+    first = next(iterator)
+
+    assert isinstance(first, EndpointDetail)
+    assert first.id == "ep-1"
+    assert [endpoint.id for endpoint in iterator] == ["ep-2"]
+    client.close()
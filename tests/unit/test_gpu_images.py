@@ -146,3 +146,49 @@ async def test_async_list_image_prewarm_tasks(httpx_mock: HTTPXMock) -> None:
         assert len(tasks) == 1
         assert tasks[0].id == "task-1"
         assert isinstance(tasks[0], ImagePrewarmTask)
+
+
+@pytest.mark.asyncio
+async def test_async_delete_many_image_prewarm_tasks(httpx_mock: HTTPXMock) -> None:
+    """Test deleting several image prewarm tasks concurrently."""
+    from novita import AsyncNovitaClient
+
+    for _ in range(3):
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.novita.ai/gpu-instance/openapi/v1/image/prewarm/delete",
+            status_code=200,
+        )
+
+    async with AsyncNovitaClient(api_key="test-key") as client:
+        await client.gpu.image_prewarm.delete_many(["task-1", "task-2", "task-3"])
+
+    requests_made = httpx_mock.get_requests()
+    assert len(requests_made) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_create_many_image_prewarm_tasks(httpx_mock: HTTPXMock) -> None:
+    """Test creating several image prewarm tasks concurrently."""
+    from novita import AsyncNovitaClient
+
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/image/prewarm",
+        json={"id": "task-1"},
+    )
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/image/prewarm",
+        json={"id": "task-2"},
+    )
+
+    requests = [
+        CreateImagePrewarmRequest(image_url="docker.io/image-a:latest", cluster_id="cluster-1"),
+        CreateImagePrewarmRequest(image_url="docker.io/image-b:latest", cluster_id="cluster-1"),
+    ]
+
+    async with AsyncNovitaClient(api_key="test-key") as client:
+        responses = await client.gpu.image_prewarm.create_many(requests)
+
+    assert [response.id for response in responses] == ["task-1", "task-2"]
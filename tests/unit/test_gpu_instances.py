@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from itertools import islice
 
 import pytest
 from pytest_httpx import HTTPXMock
@@ -258,6 +259,73 @@ def test_save_image(httpx_mock: HTTPXMock) -> None:
     client.close()
 
 
+def test_iter_instances_paginates(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/gpu/instances?pageSize=2&pageNum=0",
+        json={
+            "instances": [_instance_payload(id="inst-1"), _instance_payload(id="inst-2")],
+            "total": 3,
+        },
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/gpu/instances?pageSize=2&pageNum=1",
+        json={"instances": [_instance_payload(id="inst-3")], "total": 3},
+    )
+
+    client = NovitaClient(api_key="test-key")
+    ids = [instance.id for instance in client.gpu.instances.iter(page_size=2)]
+
+    assert ids == ["inst-1", "inst-2", "inst-3"]
+    client.close()
+
+
+def test_iter_instances_stops_early(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/gpu/instances?pageSize=2&pageNum=0",
+        json={
+            "instances": [_instance_payload(id="inst-1"), _instance_payload(id="inst-2")],
+            "total": 4,
+        },
+    )
+
+    client = NovitaClient(api_key="test-key")
+    first = next(islice(client.gpu.instances.iter(page_size=2), 1))
+
+    # Only the first page is fetched when iteration stops early
+    assert first.id == "inst-1"
+    assert len(httpx_mock.get_requests()) == 1
+    client.close()
+
+
+def test_wait_for_status(httpx_mock: HTTPXMock) -> None:
+    url = "https://api.novita.ai/gpu-instance/openapi/v1/gpu/instance?instanceId=inst-123"
+    httpx_mock.add_response(method="GET", url=url, json=_instance_payload(id="inst-123"))
+    httpx_mock.add_response(
+        method="GET", url=url, json=_instance_payload(id="inst-123", status="exited")
+    )
+
+    client = NovitaClient(api_key="test-key")
+    instance = client.gpu.instances.wait_for_status("inst-123", "exited", timeout=30)
+
+    assert instance.status.value == "exited"
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_status(httpx_mock: HTTPXMock) -> None:
+    url = "https://api.novita.ai/gpu-instance/openapi/v1/gpu/instance?instanceId=inst-123"
+    httpx_mock.add_response(
+        method="GET", url=url, json=_instance_payload(id="inst-123", status="exited")
+    )
+
+    async with AsyncNovitaClient(api_key="test-key") as client:
+        instance = await client.gpu.instances.wait_for_status("inst-123", "exited", timeout=30)
+        assert instance.status.value == "exited"
+
+
 @pytest.mark.asyncio
 async def test_async_create_instance(httpx_mock: HTTPXMock) -> None:
     httpx_mock.add_response(
@@ -306,3 +374,81 @@ async def test_async_edit_instance(httpx_mock: HTTPXMock) -> None:
     async with AsyncNovitaClient(api_key="test-key") as client:
         await client.gpu.instances.edit(request)
     assert _last_request_json(httpx_mock)["instanceId"] == "inst-async"
+
+
+@pytest.mark.asyncio
+async def test_async_get_many_instances(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/gpu/instance?instanceId=inst-1",
+        json=_instance_payload(id="inst-1"),
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/gpu/instance?instanceId=inst-2",
+        json=_instance_payload(id="inst-2"),
+    )
+
+    async with AsyncNovitaClient(api_key="test-key") as client:
+        instances = await client.gpu.instances.get_many(["inst-1", "inst-2"])
+
+    assert [instance.id for instance in instances] == ["inst-1", "inst-2"]
+
+
+@pytest.mark.asyncio
+async def test_async_stop_many_instances(httpx_mock: HTTPXMock) -> None:
+    for _ in range(3):
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.novita.ai/gpu-instance/openapi/v1/gpu/instance/stop",
+            json={},
+        )
+
+    async with AsyncNovitaClient(api_key="test-key") as client:
+        await client.gpu.instances.stop_many(["inst-1", "inst-2", "inst-3"])
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_get_instance_opt_in_cache(httpx_mock: HTTPXMock) -> None:
+    from novita.api.resources.gpu.instances import Instances
+
+    httpx_mock.add_response(
+        method="GET",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/gpu/instance?instanceId=inst-1",
+        json=_instance_payload(id="inst-1"),
+    )
+
+    client = NovitaClient(api_key="test-key")
+    instances = Instances(client._http_client, cache_ttl=60.0)
+    first = instances.get("inst-1")
+    second = instances.get("inst-1")
+
+    assert second is first
+    assert len(httpx_mock.get_requests()) == 1
+    client.close()
+
+
+def test_instance_mutation_clears_cache(httpx_mock: HTTPXMock) -> None:
+    from novita.api.resources.gpu.instances import Instances
+
+    for _ in range(2):
+        httpx_mock.add_response(
+            method="GET",
+            url="https://api.novita.ai/gpu-instance/openapi/v1/gpu/instance?instanceId=inst-1",
+            json=_instance_payload(id="inst-1"),
+        )
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.novita.ai/gpu-instance/openapi/v1/gpu/instance/stop",
+        json={},
+    )
+
+    client = NovitaClient(api_key="test-key")
+    instances = Instances(client._http_client, cache_ttl=60.0)
+    instances.get("inst-1")
+    instances.stop("inst-1")
+    instances.get("inst-1")
+
+    assert len(httpx_mock.get_requests()) == 3
+    client.close()
@@ -0,0 +1,83 @@
+"""Tests for the retry-with-jitter helper."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from novita._retry import retry
+from novita.exceptions import APIError, BadRequestError, TimeoutError
+
+
+def test_retry_recovers_from_transient_errors() -> None:
+    calls = 0
+
+    @retry(retries=3, base=0.0)
+    def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise APIError("Server error (503)", status_code=503)
+        return "ok"
+
+    assert flaky() == "ok"
+    assert calls == 3
+
+
+def test_retry_does_not_retry_client_errors() -> None:
+    calls = 0
+
+    @retry(retries=3, base=0.0)
+    def bad_request() -> None:
+        nonlocal calls
+        calls += 1
+        raise BadRequestError("Bad request")
+
+    with pytest.raises(BadRequestError):
+        bad_request()
+    assert calls == 1
+
+
+def test_retry_gives_up_after_max_retries() -> None:
+    calls = 0
+
+    @retry(retries=2, base=0.0)
+    def always_down() -> None:
+        nonlocal calls
+        calls += 1
+        raise TimeoutError("Request timed out")
+
+    with pytest.raises(TimeoutError):
+        always_down()
+    assert calls == 3
+
+
+def test_retry_recovers_from_httpx_timeouts() -> None:
+    calls = 0
+
+    @retry(retries=3, base=0.0)
+    def slow_network() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise httpx.ReadTimeout("timed out")
+        return "ok"
+
+    assert slow_network() == "ok"
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_async_recovers_from_transient_errors() -> None:
+    calls = 0
+
+    @retry(retries=3, base=0.0)
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 2:
+            raise APIError("Server error (500)", status_code=500)
+        return "ok"
+
+    assert await flaky() == "ok"
+    assert calls == 2